@@ -28,20 +28,31 @@ USAGE
   # Single question
   python agent/crypto_agent.py "What is the price of Bitcoin today?"
 
+  # Several questions — run concurrently, answers printed in order
+  python agent/crypto_agent.py "Price of BTC?" "Price of ETH?" "BTC dominance this week?"
+
   # Interactive mode (keeps asking until you type 'exit')
   python agent/crypto_agent.py --interactive
 
   # Demo mode — no Snowflake needed
   python agent/crypto_agent.py --demo "What is the price of Bitcoin today?"
   python agent/crypto_agent.py --demo --interactive
+
+  # Bypass the local LLM response cache (always call OpenAI)
+  python agent/crypto_agent.py --no-cache "What is the price of Bitcoin today?"
 """
 
 import argparse
-import json
+import asyncio
+import atexit
+import functools
+import hashlib
 import os
 import re
 import sys
+import threading
 import time
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -50,16 +61,30 @@ from typing import Any
 # Give a clear error if packages aren't installed rather than a traceback
 _MISSING = []
 try:
-    import chromadb
-    from chromadb.utils import embedding_functions
+    import numpy as np
 except ImportError:
-    _MISSING.append("chromadb")
+    _MISSING.append("numpy")
 
 try:
     from openai import OpenAI
 except ImportError:
     _MISSING.append("openai")
 
+try:
+    import diskcache
+except ImportError:
+    _MISSING.append("diskcache")
+
+try:
+    import orjson
+except ImportError:
+    _MISSING.append("orjson")
+
+try:
+    import pyarrow as pa
+except ImportError:
+    _MISSING.append("pyarrow")
+
 if _MISSING:
     print(f"Missing packages: {', '.join(_MISSING)}")
     print("Run: pip install -r requirements-agent.txt")
@@ -72,13 +97,31 @@ load_dotenv()
 
 OPENAI_API_KEY  = os.environ["OPENAI_API_KEY"]
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+# LOCAL_EMBEDDINGS=1 embeds on CPU with sentence-transformers instead of the
+# OpenAI API — no network on the retrieval path, handy for CI and demos.
+LOCAL_EMBEDDINGS      = os.getenv("LOCAL_EMBEDDINGS", "0") == "1"
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+# Schemas this small are sent whole — retrieval would cost an embedding call
+# to trim a prompt that is already short.
+SEND_ALL_SCHEMA_MAX_DOCS = int(os.getenv("SEND_ALL_SCHEMA_MAX_DOCS", "4"))
+SKIP_RETRIEVAL           = os.getenv("SKIP_RETRIEVAL", "0") == "1"
 CHAT_MODEL      = os.getenv("CHAT_MODEL",       "gpt-4o")
+# Answer formatting is a presentation task — a smaller, faster model is plenty
+FORMAT_MODEL    = os.getenv("FORMAT_MODEL",     "gpt-4o-mini")
 MAX_ROWS        = int(os.getenv("MAX_ROWS",  "200"))
 
-SCHEMA_FILE    = Path(__file__).parent / "crypto_schema.json"
-CHROMA_DIR     = Path(__file__).parent / ".chroma_cache"
-CHROMA_COLL    = "crypto_schema"
-DEMO_DB_PATH   = Path(__file__).parent / "demo_data.duckdb"
+SCHEMA_FILE       = Path(__file__).parent / "crypto_schema.json"
+CACHE_DIR         = Path(__file__).parent / ".chroma_cache"
+# Schema embeddings live outside the checkout so they survive redeploys and
+# Streamlit restarts; one file per schema hash.
+INDEX_CACHE_DIR   = Path(os.getenv("CRYPTO_AGENT_CACHE_DIR", Path.home() / ".cache" / "crypto-agent")) / "index"
+DEMO_DB_PATH      = Path(__file__).parent / "demo_data.duckdb"
+LLM_CACHE_DIR     = CACHE_DIR / "llm_cache"
+
+# LLM response cache. SQL generation runs at temperature=0 so it is always
+# safe to cache; answer formatting (temperature=0.2) is opt-in.
+LLM_CACHE_ENABLED    = os.getenv("LLM_CACHE", "1") != "0"
+CACHE_FORMAT_ANSWERS = os.getenv("CACHE_FORMAT_ANSWERS", "0") == "1"
 
 # Snowflake connection config (only needed if not in demo mode)
 SF_ACCOUNT   = os.getenv("SNOWFLAKE_ACCOUNT",   "")
@@ -89,26 +132,105 @@ SF_WAREHOUSE = os.getenv("SNOWFLAKE_WAREHOUSE",  "CRYPTO_WH")
 SF_DATABASE  = os.getenv("SNOWFLAKE_DATABASE",   "CRYPTO")
 SF_SCHEMA    = os.getenv("SNOWFLAKE_SCHEMA",     "ANALYTICS")
 
+# One OpenAI client for the whole process. Building a client per call re-creates
+# the underlying httpx pool, so every question paid a fresh TCP + TLS handshake.
+# A shared client keeps connections alive between calls.
+_OPENAI = OpenAI(api_key=OPENAI_API_KEY, timeout=30.0, max_retries=2)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LLM RESPONSE CACHE
+#
+# Both OpenAI calls in ask() are keyed by (model, prompt). A repeated question
+# produces the same prompt, so the second time round we skip the network call
+# entirely and read the response from a disk-backed LRU in .chroma_cache/.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_LLM_CACHE: "diskcache.Cache | None" = None
+
+
+def _llm_cache() -> "diskcache.Cache":
+    """Open the on-disk response cache lazily (first cached call only)."""
+    global _LLM_CACHE
+    if _LLM_CACHE is None:
+        _LLM_CACHE = diskcache.Cache(
+            str(LLM_CACHE_DIR),
+            eviction_policy="least-recently-used",
+        )
+    return _LLM_CACHE
+
+
+def _cache_key(model: str, system: str, prompt: str) -> str:
+    return hashlib.sha256((model + "\0" + system + "\0" + prompt).encode()).hexdigest()
+
+
+def _complete(
+    prompt: str,
+    *,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    cacheable: bool,
+    system: str | None = None,
+    stop: list[str] | None = None,
+) -> str:
+    """
+    Run one chat completion, serving it from the response cache when possible.
+
+    Cache entries are stored as {response_text, created_at}; created_at is kept
+    so stale entries can be inspected or pruned by hand.
+    """
+    use_cache = cacheable and LLM_CACHE_ENABLED
+    key = _cache_key(model, system or "", prompt)
+
+    if use_cache:
+        hit = _llm_cache().get(key)
+        if hit is not None:
+            return hit["response_text"]
+
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+
+    response = _OPENAI.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stop=stop,
+    )
+    text = response.choices[0].message.content.strip()
+
+    if use_cache:
+        _llm_cache().set(key, {
+            "response_text": text,
+            "created_at":    datetime.now(timezone.utc).isoformat(),
+        })
+    return text
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # STEP 1 — Schema Indexing
 #
-# We read crypto_schema.json and build a ChromaDB vector index.
-# Each table gets embedded as one text chunk (name + description + columns).
-# The index is persisted to .chroma_cache/ so we only pay for embedding once.
+# We read crypto_schema.json and embed each table as one text chunk
+# (name + description + columns). With only a handful of tables, a vector
+# database is overkill: the whole index is one small NumPy matrix, and an exact
+# inner-product search over it is faster than any approximate index.
+# The embeddings are persisted to ~/.cache/crypto-agent/index/<hash>.npz, keyed
+# by a hash of crypto_schema.json, so we only pay for embedding once per schema
+# edit — not once per process restart or redeploy.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _load_schema_docs() -> list[dict]:
+def _load_schema_docs(raw: bytes) -> list[dict]:
     """
-    Read crypto_schema.json and convert each table into an indexable text chunk.
+    Parse crypto_schema.json (raw bytes) and convert each table into an indexable text chunk.
 
     Why one chunk per table (not per column)?
       A question like "what is Bitcoin's price?" needs context about the whole
       CURRENT_TOP_10 table — not just the price_usd column in isolation.
       Keeping all columns together gives the LLM a complete picture.
     """
-    with open(SCHEMA_FILE) as f:
-        schema = json.load(f)
+    schema = orjson.loads(raw)
 
     docs = []
     for table in schema["tables"]:
@@ -140,42 +262,129 @@ def _load_schema_docs() -> list[dict]:
     return docs
 
 
-def build_index(force_rebuild: bool = False) -> chromadb.Collection:
+# The embeddings endpoint accepts up to 2,048 inputs per request
+EMBED_BATCH_SIZE = 2048
+
+
+_LOCAL_ENCODER = None
+
+
+def _local_encoder():
+    """Load the sentence-transformers model once, on first use."""
+    global _LOCAL_ENCODER
+    if _LOCAL_ENCODER is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            print("LOCAL_EMBEDDINGS=1 needs sentence-transformers. Run: pip install sentence-transformers")
+            sys.exit(1)
+        _LOCAL_ENCODER = SentenceTransformer(LOCAL_EMBEDDING_MODEL)
+    return _LOCAL_ENCODER
+
+
+def _embedding_model_id() -> str:
+    """Name of the active embedding model — part of the schema index cache key."""
+    return f"local:{LOCAL_EMBEDDING_MODEL}" if LOCAL_EMBEDDINGS else EMBEDDING_MODEL
+
+
+def _embed(texts: list[str]) -> np.ndarray:
+    """
+    Embed texts in as few API calls as possible. Returns L2-normalised float32 rows.
+
+    All schema docs go out in a single request (one per 2,048 docs), so a
+    rebuild costs one round-trip regardless of how many tables are indexed.
+    With LOCAL_EMBEDDINGS=1 the texts are encoded in-process instead.
+    """
+    if LOCAL_EMBEDDINGS:
+        vecs = _local_encoder().encode(texts, normalize_embeddings=True)
+        return np.asarray(vecs, dtype=np.float32)
+
+    vectors = []
+    for i in range(0, len(texts), EMBED_BATCH_SIZE):
+        resp = _OPENAI.embeddings.create(model=EMBEDDING_MODEL, input=texts[i:i + EMBED_BATCH_SIZE])
+        vectors.extend(d.embedding for d in resp.data)
+    vecs = np.asarray(vectors, dtype=np.float32)
+    return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+@functools.lru_cache(maxsize=4096)
+def _embed_question(question: str) -> np.ndarray:
+    """
+    Embed one question, reusing earlier embeddings of the same text.
+
+    Repeat questions skip the embeddings round-trip: in memory for this
+    process, and via the on-disk LLM cache across restarts. Local embeddings
+    are cheap enough to recompute, so they only use the in-memory tier.
     """
-    Build or load the ChromaDB schema index.
+    use_disk = LLM_CACHE_ENABLED and not LOCAL_EMBEDDINGS
+    key = _cache_key(_embedding_model_id(), "embedding", question)
+    vec = _llm_cache().get(key) if use_disk else None
+    if vec is None:
+        vec = _embed([question])[0]
+        if use_disk:
+            _llm_cache().set(key, vec)
+    vec.setflags(write=False)   # shared by every caller of the cache
+    return vec
+
+
+# Joins table chunks into the SCHEMA block of the SQL prompt
+_SCHEMA_SEPARATOR = "\n\n---\n\n"
+
 
-    First run: calls OpenAI to embed 4 schema chunks (~$0.0001).
-    Subsequent runs: loads from .chroma_cache/ — instant, no API calls.
+class SchemaIndex:
+    """
+    In-memory schema index: one normalised embedding row per table.
+
+    Rows are unit length, so cosine similarity is a plain dot product:
+    scores = M @ q.
+    """
+
+    def __init__(self, docs: list[dict], embeddings: np.ndarray) -> None:
+        self.docs       = docs
+        self.embeddings = embeddings
+        # The whole-schema answer for retrieve_schema, built once per index
+        # (a rebuilt index is a new object, so these never go stale)
+        self.tables       = [d["metadata"]["table_name"] for d in docs]
+        self.full_context = _SCHEMA_SEPARATOR.join(d["text"] for d in docs)
+
+    def count(self) -> int:
+        return len(self.docs)
+
+    def query(self, question: str, n: int) -> list[dict]:
+        """Return the n docs most similar to the question, best first."""
+        scores = self.embeddings @ _embed_question(question)
+        n = min(n, len(self.docs))
+        top = np.argpartition(-scores, n - 1)[:n]
+        top = top[np.argsort(-scores[top])]
+        return [self.docs[i] for i in top]
+
+
+def build_index(force_rebuild: bool = False) -> SchemaIndex:
+    """
+    Build or load the schema index.
+
+    First run: calls OpenAI once to embed all schema chunks (~$0.0001).
+    Subsequent runs: loads from INDEX_CACHE_DIR/<hash>.npz — instant, no API calls.
+    Editing crypto_schema.json changes its hash, which triggers a rebuild.
 
     Args:
-        force_rebuild: Delete and rebuild. Use after editing crypto_schema.json.
+        force_rebuild: Ignore the cache and re-embed.
     """
-    openai_ef = embedding_functions.OpenAIEmbeddingFunction(
-        api_key=OPENAI_API_KEY,
-        model_name=EMBEDDING_MODEL,
-    )
-    client = chromadb.PersistentClient(path=str(CHROMA_DIR))
-    existing = [c.name for c in client.list_collections()]
+    raw         = SCHEMA_FILE.read_bytes()
+    docs        = _load_schema_docs(raw)
+    schema_hash = hashlib.sha256(raw + _embedding_model_id().encode()).hexdigest()
 
-    if CHROMA_COLL in existing and not force_rebuild:
-        return client.get_collection(CHROMA_COLL, embedding_function=openai_ef)
+    index_file  = INDEX_CACHE_DIR / f"{schema_hash}.npz"
 
-    if CHROMA_COLL in existing:
-        client.delete_collection(CHROMA_COLL)
+    if index_file.exists() and not force_rebuild:
+        with np.load(index_file) as cached:
+            return SchemaIndex(docs, cached["embeddings"])
 
-    collection = client.create_collection(
-        CHROMA_COLL,
-        embedding_function=openai_ef,
-        metadata={"hnsw:space": "cosine"},
-    )
-    docs = _load_schema_docs()
-    collection.add(
-        ids=[d["id"] for d in docs],
-        documents=[d["text"] for d in docs],
-        metadatas=[d["metadata"] for d in docs],
-    )
+    embeddings = _embed([d["text"] for d in docs])
+    INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    np.savez(index_file, embeddings=embeddings)
     print(f"[agent] Schema index built — {len(docs)} tables indexed.")
-    return collection
+    return SchemaIndex(docs, embeddings)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -186,7 +395,30 @@ def build_index(force_rebuild: bool = False) -> chromadb.Collection:
 # not the entire schema.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def retrieve_schema(collection: chromadb.Collection, question: str, n: int = 2) -> tuple[str, list[str]]:
+def warm_up(index: SchemaIndex, demo_mode: bool | None = None) -> None:
+    """
+    Pay first-call costs before the user asks anything.
+
+    The first question otherwise absorbs the embedding backend warm-up (TLS
+    handshake to OpenAI, or loading the local model) and the OpenAI chat
+    connection setup. The embedding backend is only warmed when questions
+    will actually be embedded (see retrieve_schema). With demo_mode given, the shared DuckDB / Snowflake
+    connection for that backend is opened too. Best-effort: failures here
+    surface on the real question.
+    """
+    try:
+        if not SKIP_RETRIEVAL and index.count() > SEND_ALL_SCHEMA_MAX_DOCS:
+            index.query("warmup", 1)
+        _OPENAI.models.list()
+        if demo_mode is True and DEMO_DB_PATH.exists():
+            _duckdb_conn()
+        elif demo_mode is False:
+            _snowflake_conn()
+    except Exception:
+        pass
+
+
+def retrieve_schema(index: SchemaIndex, question: str, n: int = 2) -> tuple[str, list[str]]:
     """
     Find the schema chunks most relevant to the question via cosine similarity.
 
@@ -195,15 +427,21 @@ def retrieve_schema(collection: chromadb.Collection, question: str, n: int = 2)
 
     Why n=2? Most crypto questions involve 1 table. Retrieving 2 gives the LLM
     a fallback if the first match isn't quite right, without bloating the prompt.
+
+    When the whole schema is SEND_ALL_SCHEMA_MAX_DOCS tables or fewer (or
+    SKIP_RETRIEVAL=1), every table is returned and no embedding call is made.
     """
-    results = collection.query(
-        query_texts=[question],
-        n_results=min(n, collection.count()),
-    )
-    docs   = results["documents"][0]
-    metas  = results["metadatas"][0]
-    tables = [m["table_name"] for m in metas]
-    return "\n\n---\n\n".join(docs), tables
+    if SKIP_RETRIEVAL or index.count() <= SEND_ALL_SCHEMA_MAX_DOCS:
+        # Small schema: sending every table costs fewer tokens than it saves,
+        # and skips the question embedding round-trip entirely.
+        return index.full_context, list(index.tables)
+
+    # Schema order, not score order: questions that retrieve the same tables
+    # then send a byte-identical prompt prefix, which OpenAI's prompt cache
+    # can reuse
+    docs = sorted(index.query(question, n), key=lambda d: d["metadata"]["table_name"])
+    tables = [d["metadata"]["table_name"] for d in docs]
+    return _SCHEMA_SEPARATOR.join(d["text"] for d in docs), tables
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -215,6 +453,48 @@ def retrieve_schema(collection: chromadb.Collection, question: str, n: int = 2)
 #   2. "Today" / "current" maps to MAX(fetched_at), not CURRENT_DATE — mentioned explicitly
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# View names resolved for each backend once at import: plain in DuckDB, fully
+# qualified in Snowflake. Used by the fast-path templates and the prompt notes.
+_VIEWS = ("current_top_10", "daily_coin_prices", "price_history_7d", "btc_dominance_trend")
+TABLE_NAMES_DEMO = {name: name for name in _VIEWS}
+TABLE_NAMES_SF   = {name: f"{SF_DATABASE}.{SF_SCHEMA}.{name.upper()}" for name in _VIEWS}
+_TABLE_NAMES     = {True: TABLE_NAMES_DEMO, False: TABLE_NAMES_SF}
+
+
+def _sql_system_prompt(dialect: str, table_note: str) -> str:
+    return f"""You are an expert {dialect} SQL analyst for CoinMarketCap market data.
+Write one SELECT query answering the user's question.
+
+Rules:
+- Case-insensitive symbol match: UPPER(symbol) = UPPER('BTC') or ILIKE.
+- "Today"/"current"/"now"/"latest" → current_top_10 (already the latest snapshot).
+- Historical questions → daily_coin_prices or price_history_7d.
+- Always SELECT as_of or fetched_at so the user sees data freshness.
+- {table_note}
+- Output SQL only: no explanation, markdown or code fences.
+- Always include LIMIT {MAX_ROWS}.
+- If the schema cannot answer it, output: CANNOT_ANSWER"""
+
+
+# Dialect and table-naming note are pure functions of the mode, so they are
+# fixed here rather than worked out on every generate_sql call.
+_PROMPT_CTX = {
+    True:  ("DuckDB", "Use plain table names (e.g. current_top_10, daily_coin_prices)."),
+    False: (
+        "Snowflake",
+        "Use fully qualified Snowflake names as shown in the schema "
+        f"(e.g. {TABLE_NAMES_SF['current_top_10']}).",
+    ),
+}
+
+# The instructions only vary by mode, so both variants are built once at import.
+# They go in the system message, ahead of anything question-specific: an
+# identical leading prefix is what OpenAI's automatic prompt caching matches on.
+_STATIC_PREFIX = {mode: _sql_system_prompt(*ctx) for mode, ctx in _PROMPT_CTX.items()}
+
+_SQL_PROMPT = "SCHEMA:\n{schema_context}\n\nQUESTION: {question}\n\nSQL:"
+
+
 def generate_sql(question: str, schema_context: str, demo_mode: bool) -> str:
     """
     Call GPT-4o to generate a SQL query.
@@ -225,44 +505,21 @@ def generate_sql(question: str, schema_context: str, demo_mode: bool) -> str:
       - Always include as_of or fetched_at in SELECT so the answer shows data freshness
       - Data freshness note: the pipeline runs on a schedule, so "today" = last fetch
 
-    Temperature=0: SQL must be deterministic. Same question → same SQL.
+    Temperature=0: SQL must be deterministic. Same question → same SQL,
+    which is also what makes the response safe to serve from the LLM cache.
     """
-    dialect = "DuckDB" if demo_mode else "Snowflake"
-    # In demo mode we use simple table names; in Snowflake mode, fully qualified
-    table_note = (
-        "Use plain table names (e.g. current_top_10, daily_coin_prices)."
-        if demo_mode else
-        "Use fully qualified Snowflake names as shown in the schema (e.g. CRYPTO.ANALYTICS.CURRENT_TOP_10)."
-    )
-
-    prompt = f"""You are an expert {dialect} SQL analyst working with CoinMarketCap market data.
-Write a single SELECT query to answer the question below.
-
-IMPORTANT CRYPTO-SPECIFIC RULES:
-- Symbol matching must be case-insensitive: use UPPER(symbol) = UPPER('BTC') or ILIKE
-- "Today", "current", "now", "latest" → use the current_top_10 table (already filtered to latest)
-- For historical questions → use daily_coin_prices or price_history_7d
-- Always include the as_of or fetched_at column in SELECT so the user knows how fresh the data is
-- {table_note}
-- Output ONLY the SQL — no explanation, no markdown, no code fences
-- Always include LIMIT {MAX_ROWS}
-- If you cannot answer from the available schema, output: CANNOT_ANSWER
+    prompt = _SQL_PROMPT.format(schema_context=schema_context, question=question)
 
-SCHEMA CONTEXT:
-{schema_context}
-
-QUESTION: {question}
-
-SQL QUERY:"""
-
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    response = client.chat.completions.create(
+    sql = _complete(
+        prompt,
+        system=_STATIC_PREFIX[demo_mode],
         model=CHAT_MODEL,
-        messages=[{"role": "user", "content": prompt}],
         temperature=0,
-        max_tokens=512,
+        # Typical SQL is well under 200 tokens; stop at the end of the statement
+        max_tokens=256,
+        stop=[";\n\n"],
+        cacheable=True,
     )
-    sql = response.choices[0].message.content.strip()
 
     # Strip markdown code fences if the model added them anyway
     if sql.startswith("```"):
@@ -272,6 +529,57 @@ SQL QUERY:"""
     return sql
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# STEP 3a — Fast Path for Canned Questions
+#
+# Some questions are so common and so regular ("price of BTC", "top 10 coins")
+# that sending them to GPT-4o just burns a second and some tokens to get back
+# SQL we could have written ourselves. These are matched against whole-question
+# patterns and answered from fixed SQL templates; anything that doesn't match
+# exactly falls through to the normal retrieve → generate path.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# (pattern, table, template). Patterns are anchored to the whole question so
+# "price of BTC last week" is NOT routed to the current-price template.
+# Captured symbols are \w-only and length-capped, so they are safe to inline.
+FAST_PATTERNS = [
+    (
+        re.compile(r"(?i)^\s*(?:what(?:'s| is)\s+)?(?:the\s+)?(?:current\s+)?price of (\w+)(?:\s+(?:today|now))?\s*\??\s*$"),
+        "current_top_10",
+        lambda m, tbl: (
+            f"SELECT symbol, name, price_usd, change_24h_pct, as_of FROM {tbl} "
+            f"WHERE UPPER(symbol) = UPPER('{m.group(1)[:32]}') OR UPPER(name) = UPPER('{m.group(1)[:32]}') "
+            f"LIMIT {MAX_ROWS}"
+        ),
+    ),
+    (
+        re.compile(r"(?i)^\s*(?:show\s+(?:me\s+)?)?(?:the\s+)?top 10(?: coins)?(?: by market cap)?\s*\??\s*$"),
+        "current_top_10",
+        lambda m, tbl: (
+            f"SELECT rank, symbol, name, price_usd, market_cap_usd, change_24h_pct, as_of FROM {tbl} "
+            f"ORDER BY rank LIMIT {MAX_ROWS}"
+        ),
+    ),
+    (
+        re.compile(r"(?i)^\s*(?:what(?:'s| is)\s+)?(?:the\s+)?(?:btc|bitcoin) dominance(?:\s+(?:today|now))?\s*\??\s*$"),
+        "btc_dominance_trend",
+        lambda m, tbl: (
+            f"SELECT metric_date, avg_btc_dominance_pct FROM {tbl} "
+            f"ORDER BY metric_date DESC LIMIT 1"
+        ),
+    ),
+]
+
+
+def fast_path_sql(question: str, demo_mode: bool) -> tuple[str, str] | None:
+    """Return (sql, table_name) if the question matches a canned pattern, else None."""
+    for pattern, table, template in FAST_PATTERNS:
+        m = pattern.match(question)
+        if m:
+            return template(m, _TABLE_NAMES[demo_mode][table]), table
+    return None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # STEP 4 — SQL Validation
 #
@@ -283,6 +591,14 @@ SQL QUERY:"""
 
 BLOCKED = {"DROP","DELETE","TRUNCATE","UPDATE","INSERT","MERGE","ALTER","CREATE","GRANT","REVOKE","EXECUTE","EXEC","CALL"}
 
+# Compiled once: one alternation scan instead of a re.search per keyword.
+# Longest keywords first so EXECUTE is reported as EXECUTE, not EXEC.
+_BLOCKED_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(BLOCKED, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE,
+)
+_SELECT_RE = re.compile(r"\s*(SELECT|WITH)\b", re.IGNORECASE)
+
 class ValidationError(Exception):
     pass
 
@@ -295,12 +611,12 @@ def validate_sql(sql: str) -> str:
             "Try asking about coin prices, market caps, volume, or BTC dominance."
         )
     normalised = " ".join(sql.split())
-    first = normalised.lstrip().split()[0].upper()
-    if first not in ("SELECT", "WITH"):
+    if not _SELECT_RE.match(normalised):
+        first = normalised.split()[0].upper()
         raise ValidationError(f"Only SELECT queries are allowed. Got: {first}")
-    for kw in BLOCKED:
-        if re.search(rf"\b{re.escape(kw)}\b", normalised.upper()):
-            raise ValidationError(f"Blocked keyword '{kw}' in generated SQL.")
+    m = _BLOCKED_RE.search(normalised)
+    if m:
+        raise ValidationError(f"Blocked keyword '{m.group(1).upper()}' in generated SQL.")
     if "LIMIT" not in normalised.upper():
         normalised = f"{normalised.rstrip(';')} LIMIT {MAX_ROWS}"
     return normalised
@@ -313,32 +629,135 @@ def validate_sql(sql: str) -> str:
 # Both return List[Dict] — the same interface.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def execute_snowflake(sql: str) -> list[dict]:
-    """Execute against real Snowflake analytics views."""
+_SF_CONN = None
+_SF_LOCK = threading.Lock()
+
+# Snowflake error code for an expired session token (long-idle interactive sessions)
+_SF_SESSION_EXPIRED = 390114
+
+
+def _snowflake_conn(failed=None):
+    """
+    Return the process-wide Snowflake connection, opening it on first use.
+
+    Pass `failed` (the connection whose session expired) to replace it. Only
+    that exact connection is replaced: when ask_many's threads all hit the
+    same expiry, the first reconnects and the rest get its new connection
+    instead of closing it under each other.
+
+    Logging in costs 0.5–2s (auth + session setup). In interactive mode that
+    used to be paid on every question; now it is paid once per process.
+    Keep-alive heartbeats stop an idle session from expiring between
+    questions, so the reconnect in execute_snowflake stays the rare path.
+    """
+    global _SF_CONN
     import snowflake.connector
-    conn = snowflake.connector.connect(
-        account=SF_ACCOUNT, user=SF_USER, password=SF_PASSWORD,
-        database=SF_DATABASE, schema=SF_SCHEMA,
-        warehouse=SF_WAREHOUSE, role=SF_ROLE,
-    )
+    with _SF_LOCK:
+        if _SF_CONN is None or _SF_CONN is failed or _SF_CONN.is_closed():
+            if _SF_CONN is not None:
+                # Best-effort: the session being replaced may already be dead
+                try:
+                    _SF_CONN.close()
+                except Exception:
+                    pass
+            _SF_CONN = snowflake.connector.connect(
+                account=SF_ACCOUNT, user=SF_USER, password=SF_PASSWORD,
+                database=SF_DATABASE, schema=SF_SCHEMA,
+                warehouse=SF_WAREHOUSE, role=SF_ROLE,
+                client_session_keep_alive=True,
+            )
+        return _SF_CONN
+
+
+def _close_snowflake() -> None:
+    if _SF_CONN is not None:
+        _SF_CONN.close()
+
+
+atexit.register(_close_snowflake)
+
+
+def execute_snowflake(sql: str) -> pa.Table:
+    """
+    Execute against real Snowflake analytics views.
+
+    Results come back as Arrow batches and stay columnar, rather than one
+    Python dict per row from a DictCursor. We stop pulling batches once
+    MAX_ROWS is reached; format_answer only turns the rows it shows into dicts.
+    """
+    from snowflake.connector.errors import ProgrammingError
+
+    conn = _snowflake_conn()
     try:
-        cur = conn.cursor(snowflake.connector.DictCursor)
+        cur = conn.cursor()
         cur.execute(sql)
-        return cur.fetchmany(MAX_ROWS)
+    except ProgrammingError as e:
+        if e.errno != _SF_SESSION_EXPIRED:
+            raise
+        cur = _snowflake_conn(failed=conn).cursor()
+        cur.execute(sql)
+
+    try:
+        batches, fetched = [], 0
+        for batch in cur.fetch_arrow_batches():
+            batches.append(batch)
+            fetched += batch.num_rows
+            if fetched >= MAX_ROWS:
+                break
+        if not batches:
+            return pa.table({})
+        return pa.concat_tables(batches).slice(0, MAX_ROWS)
     finally:
-        conn.close()
+        cur.close()
+
+
+_DUCK = None
+_DUCK_LOCK = threading.Lock()
 
 
-def execute_duckdb(sql: str) -> list[dict]:
-    """Execute against the local DuckDB demo database."""
+def _duckdb_conn():
+    """
+    Return the process-wide read-only DuckDB connection, opening it on first use.
+
+    Opening the file (catalog load, buffer pool) cost tens of ms per question.
+    The demo DB is small and read-only, so one connection stays open and its
+    pages stay warm in the OS page cache between questions.
+    """
+    global _DUCK
     import duckdb
-    conn = duckdb.connect(str(DEMO_DB_PATH), read_only=True)
+    with _DUCK_LOCK:
+        if _DUCK is None:
+            _DUCK = duckdb.connect(
+                str(DEMO_DB_PATH),
+                read_only=True,
+                config={"memory_limit": "512MB"},
+            )
+        return _DUCK
+
+
+def _close_duckdb() -> None:
+    """Drop the shared connection (seed_demo_db needs the file for writing)."""
+    global _DUCK
+    with _DUCK_LOCK:
+        if _DUCK is not None:
+            _DUCK.close()
+            _DUCK = None
+
+
+def execute_duckdb(sql: str) -> pa.Table:
+    """
+    Execute against the local DuckDB demo database.
+
+    DuckDB hands the result over as an Arrow table (columnar, built in C++)
+    and it stays that way; format_answer only turns the handful of rows it
+    shows the model into dicts. Each call gets its own cursor on the shared
+    connection, so concurrent questions don't step on each other.
+    """
+    cur = _duckdb_conn().cursor()
     try:
-        cur  = conn.execute(sql)
-        cols = [d[0] for d in cur.description]
-        return [dict(zip(cols, row)) for row in cur.fetchall()]
+        return cur.execute(sql).fetch_arrow_table().slice(0, MAX_ROWS)
     finally:
-        conn.close()
+        cur.close()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -348,22 +767,31 @@ def execute_duckdb(sql: str) -> list[dict]:
 # Crypto-specific: always note the data freshness (as_of timestamp).
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def format_answer(question: str, sql: str, results: list[dict]) -> str:
+# Row caps for the RESULTS block: single-entity lookups rarely need more than a
+# few rows, and every extra row is input tokens the model has to read.
+ANSWER_MAX_ROWS        = 15
+ANSWER_MAX_ROWS_SINGLE = 8
+_SINGLE_ENTITY_RE = re.compile(r"\bLIMIT 1\b|\bsymbol\)?\s*=", re.IGNORECASE)
+
+
+def _results_table(results: pa.Table, sql: str) -> str:
     """
-    Call GPT-4o to turn query results into a readable answer.
+    Serialise result rows as a compact pipe-delimited table.
 
-    Key crypto additions to the prompt:
-      - Must mention data freshness ("as of [timestamp]")
-      - Format large numbers properly ($95,432.10 not 95432.1)
-      - Note if data might be stale (if as_of is old)
+    A header line plus one line per row is far fewer tokens than the Python
+    repr of a list of dicts, which repeats every column name and quote per row.
     """
-    if not results:
-        return (
-            "No data found. The pipeline may not have run yet, or the coin "
-            "you asked about isn't in the top tracked list."
-        )
+    limit   = ANSWER_MAX_ROWS_SINGLE if _SINGLE_ENTITY_RE.search(sql) else ANSWER_MAX_ROWS
+    headers = results.column_names
+    lines   = ["|".join(headers)]
+    for row in results.slice(0, limit).to_pylist():
+        lines.append("|".join("" if row.get(h) is None else str(row.get(h)) for h in headers))
+    return "\n".join(lines)
+
 
-    prompt = f"""You are a crypto market analyst. Answer the question directly and concisely.
+# Fixed instructions go in the system message, ahead of the per-question
+# block, so every answer request starts with the same cacheable prefix.
+_ANSWER_SYSTEM_PROMPT = """You are a crypto market analyst. Answer the question directly and concisely.
 
 RULES:
 - Lead with the direct answer (price, value, percentage)
@@ -372,22 +800,41 @@ RULES:
 - Always mention the data timestamp (as_of or fetched_at field) so the user knows freshness
 - If the timestamp looks old (more than a few hours), note that the pipeline may not have run recently
 - Keep it under 120 words
-- Do not quote the SQL
+- Do not quote the SQL"""
+
 
-QUESTION: {question}
+def format_answer(question: str, sql: str, results: pa.Table) -> str:
+    """
+    Call FORMAT_MODEL (gpt-4o-mini by default) to turn query results into a readable answer.
+
+    Key crypto additions to the prompt:
+      - Must mention data freshness ("as of [timestamp]")
+      - Format large numbers properly ($95,432.10 not 95432.1)
+      - Note if data might be stale (if as_of is old)
+    """
+    if results.num_rows == 0:
+        return (
+            "No data found. The pipeline may not have run yet, or the coin "
+            "you asked about isn't in the top tracked list."
+        )
+
+    prompt = f"""QUESTION: {question}
 SQL USED: {sql}
-RESULTS: {results[:15]}
+RESULTS:
+{_results_table(results, sql)}
 
 ANSWER:"""
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    resp = client.chat.completions.create(
-        model=CHAT_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+    return _complete(
+        prompt,
+        system=_ANSWER_SYSTEM_PROMPT,
+        model=FORMAT_MODEL,
         temperature=0.2,
-        max_tokens=300,
+        # 120 words ≈ 160 tokens
+        max_tokens=200,
+        stop=["\n\n\n"],
+        cacheable=CACHE_FORMAT_ANSWERS,
     )
-    return resp.choices[0].message.content.strip()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -412,6 +859,20 @@ DEMO_COINS = [
     (10, "DOT",  "Polkadot",          9.12,    12_600_000_000,     620_000_000,  -0.87,  +1.23),
 ]
 
+def _bulk_insert(conn, table: str, df) -> None:
+    """
+    Insert a DataFrame into `table` in one statement.
+
+    DuckDB scans the registered frame column by column, instead of binding
+    parameters row by row as executemany does. Columns are matched by position.
+    """
+    conn.register("_seed_df", df)
+    try:
+        conn.execute(f"INSERT INTO {table} SELECT * FROM _seed_df")
+    finally:
+        conn.unregister("_seed_df")
+
+
 def seed_demo_db():
     """
     Create demo_data.duckdb with mock data that mirrors the Snowflake view schemas.
@@ -420,11 +881,13 @@ def seed_demo_db():
     the real Snowflake views with only the table name prefix changing.
     """
     import duckdb, random
+    import pandas as pd
     random.seed(42)
 
     now     = datetime.now(timezone.utc)
     today   = date.today()
 
+    _close_duckdb()
     conn = duckdb.connect(str(DEMO_DB_PATH))
 
     # ── current_top_10 ─────────────────────────────────────────────────────────
@@ -443,7 +906,7 @@ def seed_demo_db():
         )
     """)
     rows = [(r, s, n, p, mc, v, c24, c7, now) for r, s, n, p, mc, v, c24, c7 in DEMO_COINS]
-    conn.executemany("INSERT INTO current_top_10 VALUES (?,?,?,?,?,?,?,?,?)", rows)
+    _bulk_insert(conn, "current_top_10", pd.DataFrame(rows))
 
     # ── daily_coin_prices — 30 days of history ─────────────────────────────────
     conn.execute("DROP TABLE IF EXISTS daily_coin_prices")
@@ -463,24 +926,35 @@ def seed_demo_db():
             circulating_supply  DOUBLE
         )
     """)
-    hist_rows = []
-    for days_ago in range(30, 0, -1):
-        d = today - timedelta(days=days_ago)
-        for rank, sym, name, price, mcap, vol, c24, c7 in DEMO_COINS:
-            # Simulate realistic drift — prices walk slightly each day
-            factor = 1 + random.uniform(-0.04, 0.04) * (days_ago / 30)
-            p = round(price * factor, 2)
-            hist_rows.append((
-                d, sym, name, rank, p,
-                round(vol * random.uniform(0.7, 1.3), 0),
-                round(mcap * factor, 0),
-                round(random.uniform(1, 55) if sym == "BTC" else random.uniform(0.5, 20), 2),
-                round(random.uniform(-5, 5), 2),
-                round(random.uniform(-10, 10), 2),
-                round(random.uniform(-20, 20), 2),
-                round(mcap / p, 0),
-            ))
-    conn.executemany("INSERT INTO daily_coin_prices VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", hist_rows)
+    # Generated as (days × coins) NumPy arrays rather than a nested Python loop.
+    rng      = np.random.default_rng(42)
+    days_ago = np.arange(30, 0, -1)
+    n_days, n_coins = len(days_ago), len(DEMO_COINS)
+    ranks, syms, names, prices, mcaps, vols, _, _ = (np.array(col) for col in zip(*DEMO_COINS))
+
+    # Simulate realistic drift — prices walk slightly each day
+    factor = 1 + rng.uniform(-0.04, 0.04, size=(n_days, n_coins)) * (days_ago[:, None] / 30)
+    hist_price = np.round(prices * factor, 2)
+    dominance  = np.where(
+        syms == "BTC",
+        rng.uniform(1, 55, size=(n_days, n_coins)),
+        rng.uniform(0.5, 20, size=(n_days, n_coins)),
+    )
+    hist_df = pd.DataFrame({
+        "price_date":           np.repeat([today - timedelta(days=int(d)) for d in days_ago], n_coins),
+        "symbol":               np.tile(syms, n_days),
+        "name":                 np.tile(names, n_days),
+        "rank_at_close":        np.tile(ranks, n_days).astype("int32"),
+        "price_usd":            hist_price.ravel(),
+        "volume_24h_usd":       np.round(vols * rng.uniform(0.7, 1.3, size=(n_days, n_coins)), 0).ravel(),
+        "market_cap_usd":       np.round(mcaps * factor, 0).ravel(),
+        "market_cap_dominance": np.round(dominance, 2).ravel(),
+        "pct_change_24h":       np.round(rng.uniform(-5, 5, size=(n_days, n_coins)), 2).ravel(),
+        "pct_change_7d":        np.round(rng.uniform(-10, 10, size=(n_days, n_coins)), 2).ravel(),
+        "pct_change_30d":       np.round(rng.uniform(-20, 20, size=(n_days, n_coins)), 2).ravel(),
+        "circulating_supply":   np.round(mcaps / hist_price, 0).ravel(),
+    })
+    _bulk_insert(conn, "daily_coin_prices", hist_df)
 
     # ── price_history_7d ───────────────────────────────────────────────────────
     conn.execute("DROP TABLE IF EXISTS price_history_7d")
@@ -504,7 +978,7 @@ def seed_demo_db():
             high = round(avg * random.uniform(1.01, 1.05), 2)
             low  = round(avg * random.uniform(0.95, 0.99), 2)
             week_rows.append((d, sym, name, avg, high, low, vol, random.randint(6, 24)))
-    conn.executemany("INSERT INTO price_history_7d VALUES (?,?,?,?,?,?,?,?)", week_rows)
+    _bulk_insert(conn, "price_history_7d", pd.DataFrame(week_rows))
 
     # ── btc_dominance_trend ────────────────────────────────────────────────────
     conn.execute("DROP TABLE IF EXISTS btc_dominance_trend")
@@ -529,7 +1003,7 @@ def seed_demo_db():
             round(180 + random.uniform(-20, 20), 1),
             random.randint(8900, 9100),
         ))
-    conn.executemany("INSERT INTO btc_dominance_trend VALUES (?,?,?,?,?,?)", dom_rows)
+    _bulk_insert(conn, "btc_dominance_trend", pd.DataFrame(dom_rows))
 
     conn.close()
     print(f"[demo] Mock database created at {DEMO_DB_PATH}")
@@ -540,19 +1014,67 @@ def seed_demo_db():
 # MAIN — Pipeline orchestration + CLI
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def ask(question: str, collection: chromadb.Collection, demo_mode: bool) -> dict:
+# Whole-pipeline results for recently asked questions, keyed on the question
+# with case and whitespace folded. Entries expire after RESPONSE_CACHE_TTL_S
+# because the underlying prices refresh on the pipeline's schedule.
+RESPONSE_CACHE_SIZE  = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+RESPONSE_CACHE_TTL_S = float(os.getenv("RESPONSE_CACHE_TTL_S", "300"))
+_RESPONSES: OrderedDict[tuple[str, bool], tuple[float, dict]] = OrderedDict()
+_RESPONSES_LOCK = threading.Lock()
+
+
+def _cached_response(key: tuple[str, bool]) -> dict | None:
+    with _RESPONSES_LOCK:
+        hit = _RESPONSES.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > RESPONSE_CACHE_TTL_S:
+            del _RESPONSES[key]
+            return None
+        _RESPONSES.move_to_end(key)
+        return hit[1]
+
+
+def _store_response(key: tuple[str, bool], result: dict, stored_at: float) -> None:
+    with _RESPONSES_LOCK:
+        _RESPONSES[key] = (stored_at, result)
+        _RESPONSES.move_to_end(key)
+        while len(_RESPONSES) > RESPONSE_CACHE_SIZE:
+            _RESPONSES.popitem(last=False)
+
+
+def ask(question: str, collection: SchemaIndex, demo_mode: bool) -> dict:
     """
     Run one question through the full RAG pipeline.
 
+    A question asked again within RESPONSE_CACHE_TTL_S (ignoring case and
+    spacing) is answered from memory: no retrieval, LLM or database calls.
+
     Returns a dict with: question, sql, answer, row_count, latency_ms, tables_used
     """
     t0 = time.monotonic()
 
-    # 1. Retrieve relevant schema
-    schema_ctx, tables_used = retrieve_schema(collection, question)
+    use_cache = LLM_CACHE_ENABLED and RESPONSE_CACHE_TTL_S > 0
+    cache_key = (" ".join(question.lower().split()), demo_mode)
+    if use_cache and (hit := _cached_response(cache_key)) is not None:
+        latency = round((time.monotonic() - t0) * 1000, 1)
+        # Fresh dict and list so callers can't mutate the cached entry
+        return {**hit, "tables_used": list(hit["tables_used"]), "question": question, "latency_ms": latency}
+
+    fast = fast_path_sql(question, demo_mode)
+    if fast:
+        # Canned question — skip retrieval and SQL generation entirely
+        raw_sql, table = fast
+        tables_used = [table]
+    else:
+        # The connection isn't needed until step 4; open it during the LLM call
+        _connect_in_background(demo_mode)
+
+        # 1. Retrieve relevant schema
+        schema_ctx, tables_used = retrieve_schema(collection, question)
 
-    # 2. Generate SQL
-    raw_sql = generate_sql(question, schema_ctx, demo_mode)
+        # 2. Generate SQL
+        raw_sql = generate_sql(question, schema_ctx, demo_mode)
 
     # 3. Validate
     safe_sql = validate_sql(raw_sql)
@@ -563,15 +1085,66 @@ def ask(question: str, collection: chromadb.Collection, demo_mode: bool) -> dict
     # 5. Format answer
     answer = format_answer(question, safe_sql, results)
 
-    latency = round((time.monotonic() - t0) * 1000, 1)
-    return {
+    t1 = time.monotonic()
+    latency = round((t1 - t0) * 1000, 1)
+    result = {
         "question":    question,
         "sql":         safe_sql,
         "answer":      answer,
-        "row_count":   len(results),
+        "row_count":   results.num_rows,
         "latency_ms":  latency,
         "tables_used": tables_used,
     }
+    if use_cache:
+        _store_response(cache_key, {**result, "tables_used": list(tables_used)}, t1)
+    return result
+
+
+def _connect_in_background(demo_mode: bool) -> None:
+    """
+    Open the backend connection on a worker thread if it isn't open yet.
+
+    Snowflake login takes 0.5–2s and is independent of retrieval and SQL
+    generation, so the first question overlaps the two instead of paying them
+    back to back. The execute step waits on the connection lock if the login
+    is still in flight. Best-effort: a failure here resurfaces on execute.
+    """
+    if (_DUCK if demo_mode else _SF_CONN) is not None:
+        return
+
+    def _connect() -> None:
+        try:
+            _duckdb_conn() if demo_mode else _snowflake_conn()
+        except Exception:
+            pass
+
+    threading.Thread(target=_connect, name="db-connect", daemon=True).start()
+
+
+async def ask_many(
+    questions: list[str],
+    collection: SchemaIndex,
+    demo_mode: bool,
+    max_concurrency: int = 4,
+) -> list[dict | Exception]:
+    """
+    Run several questions through ask() concurrently.
+
+    Every step of the pipeline is waiting on the network (OpenAI, Snowflake),
+    so running questions side by side overlaps those waits instead of paying
+    them back to back. Each question runs in a worker thread on the shared
+    OpenAI client; the semaphore caps how many are in flight at once.
+
+    Returns results in the same order as `questions`. A question that fails
+    returns its exception in place of a result dict.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(q: str) -> dict:
+        async with sem:
+            return await asyncio.to_thread(ask, q, collection, demo_mode)
+
+    return await asyncio.gather(*(_one(q) for q in questions), return_exceptions=True)
 
 
 def _print_result(result: dict):
@@ -589,13 +1162,18 @@ def main():
     parser = argparse.ArgumentParser(
         description="Ask natural language questions about CoinMarketCap data."
     )
-    parser.add_argument("question", nargs="?", help="Question to ask")
+    parser.add_argument("question", nargs="*", help="Question(s) to ask — several run concurrently")
     parser.add_argument("--interactive", action="store_true", help="Interactive Q&A loop")
     parser.add_argument("--demo",        action="store_true", help="Use local DuckDB mock data")
     parser.add_argument("--seed-demo",   action="store_true", help="Create/recreate demo DuckDB database")
-    parser.add_argument("--rebuild-index", action="store_true", help="Rebuild ChromaDB schema index")
+    parser.add_argument("--rebuild-index", action="store_true", help="Rebuild the schema embedding index")
+    parser.add_argument("--no-cache",    action="store_true", help="Bypass the local LLM and answer caches")
     args = parser.parse_args()
 
+    if args.no_cache:
+        global LLM_CACHE_ENABLED
+        LLM_CACHE_ENABLED = False
+
     # Seed demo database if requested
     if args.seed_demo:
         seed_demo_db()
@@ -611,6 +1189,7 @@ def main():
     collection = build_index(force_rebuild=args.rebuild_index)
 
     if args.interactive:
+        warm_up(collection, demo_mode=args.demo)
         print("\nCrypto Analytics Agent — type 'exit' to quit\n")
         while True:
             q = input("Q: ").strip()
@@ -626,13 +1205,28 @@ def main():
             except Exception as e:
                 print(f"\n[error] {e}\n")
 
-    elif args.question:
+    elif len(args.question) == 1:
         try:
-            result = ask(args.question, collection, demo_mode=args.demo)
+            result = ask(args.question[0], collection, demo_mode=args.demo)
             _print_result(result)
         except ValidationError as e:
             print(f"[validation error] {e}")
             sys.exit(1)
+
+    elif args.question:
+        results = asyncio.run(ask_many(args.question, collection, demo_mode=args.demo))
+        failed = False
+        for q, result in zip(args.question, results):
+            if isinstance(result, ValidationError):
+                print(f"\n[validation error] {q}: {result}")
+                failed = True
+            elif isinstance(result, Exception):
+                print(f"\n[error] {q}: {result}")
+                failed = True
+            else:
+                _print_result(result)
+        if failed:
+            sys.exit(1)
     else:
         parser.print_help()
 
@@ -41,8 +41,10 @@ Without session_state, the chat history would be lost each time.
 
 st.session_state["messages"] is a list that persists across re-runs.
 Each message is a dict: {"role": "user"|"assistant", "content": str, "sql": str}
+Only the most recent messages (the sidebar's "Messages kept on screen") are
+kept; older turns are dropped so long chats stay cheap to re-render.
 
-The schema index (ChromaDB collection) is also cached in session_state
+The schema index (NumPy embedding matrix) is also cached in session_state
 so it's only built once — not on every message.
 """
 
@@ -59,7 +61,9 @@ from agent.crypto_agent import (
     ask,
     build_index,
     seed_demo_db,
+    warm_up,
     DEMO_DB_PATH,
+    SCHEMA_FILE,
 )
 
 # ── Page config ───────────────────────────────────────────────────────────────
@@ -69,6 +73,18 @@ st.set_page_config(
     layout="centered",
 )
 
+# The script reruns on every widget interaction; re-stat the demo DB and the
+# schema file at most every 10s rather than on each of those reruns.
+@st.cache_data(ttl=10, show_spinner=False)
+def demo_db_exists() -> bool:
+    return DEMO_DB_PATH.exists()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def schema_mtime() -> float:
+    return SCHEMA_FILE.stat().st_mtime
+
+
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 with st.sidebar:
     st.title("⚙️ Settings")
@@ -82,11 +98,12 @@ with st.sidebar:
         ),
     )
 
-    if demo_mode and not DEMO_DB_PATH.exists():
+    if demo_mode and not demo_db_exists():
         st.warning("Demo database not found. Click below to create it.")
         if st.button("Seed demo data"):
             with st.spinner("Creating mock database..."):
                 seed_demo_db()
+            demo_db_exists.clear()
             st.success("Done — mock data ready.")
             st.rerun()
 
@@ -107,27 +124,68 @@ with st.sidebar:
         "Show me the top 10 coins by market cap",
         "Which acquisition channel produces the highest lifetime value?",
     ]
+    max_visible = st.number_input(
+        "Messages kept on screen", min_value=10, max_value=500, value=50, step=10,
+        help="Older turns are dropped from the page.",
+    )
+
     for q in EXAMPLE_QUESTIONS:
         if st.button(q, use_container_width=True):
             st.session_state["pending_question"] = q
 
     if st.button("🗑️ Clear chat", use_container_width=True):
         st.session_state["messages"] = []
+        st.session_state["history_parts"] = []
+        st.session_state["truncated_turns"] = 0
         st.rerun()
 
 # ── Schema index — built once, cached in session state ────────────────────────
 # st.cache_resource caches the return value across all sessions and re-runs.
 # Without this, the index would be rebuilt on every message — slow and costly.
-@st.cache_resource
-def get_schema_index():
-    """Build the ChromaDB schema index once and reuse it across all requests."""
+# Underneath, build_index() keeps the embeddings on disk (~/.cache/crypto-agent),
+# so a process restart reloads them instead of calling the embedding API again.
+# Keyed on the schema file's mtime, so editing crypto_schema.json is picked up
+# within ~10s without restarting the server; max_entries=1 drops the stale index.
+@st.cache_resource(max_entries=1)
+def get_schema_index(schema_mtime: float):
+    """Build the schema index once per schema version and reuse it across all requests."""
     return build_index()
 
-collection = get_schema_index()
+collection = get_schema_index(schema_mtime())
+
+
+# The OpenAI client and the DuckDB / Snowflake connections are process-wide
+# singletons inside crypto_agent, so reruns already reuse them. This opens them
+# once per backend up front, so the first question doesn't pay the TLS
+# handshake or Snowflake login.
+@st.cache_resource(show_spinner=False)
+def warm_backend(demo_mode: bool) -> bool:
+    warm_up(collection, demo_mode=demo_mode)
+    return True
+
+warm_backend(demo_mode)
+
 
 # ── Chat history ──────────────────────────────────────────────────────────────
 if "messages" not in st.session_state:
     st.session_state["messages"] = []
+    # Rendered markdown for messages[:len(history_parts)], kept across reruns so
+    # each turn is formatted once, not on every rerun
+    st.session_state["history_parts"] = []
+    st.session_state["truncated_turns"] = 0
+
+
+def add_message(msg: dict) -> None:
+    """Append to the chat history, dropping the oldest turns beyond the window."""
+    messages = st.session_state["messages"]
+    messages.append(msg)
+    overflow = len(messages) - max_visible
+    if overflow <= 0:
+        return
+
+    del messages[:overflow]
+    del st.session_state["history_parts"][:overflow]
+    st.session_state["truncated_turns"] += overflow
 
 # ── Header ────────────────────────────────────────────────────────────────────
 st.title("🪙 Crypto Analytics Agent")
@@ -136,7 +194,46 @@ st.caption(f"Ask anything about crypto market data — powered by GPT-4o · {mod
 st.divider()
 
 # ── Render chat history ───────────────────────────────────────────────────────
-for msg in st.session_state["messages"]:
+if st.session_state["truncated_turns"]:
+    st.caption(f"… {st.session_state['truncated_turns']} earlier messages truncated …")
+
+# Every Streamlit element is its own message to the browser, so rendering each
+# old turn as chat_message + markdown + expander + code + caption costs ~5
+# elements per turn. Older turns are folded into ONE markdown block instead;
+# only the latest exchange keeps the interactive chat widgets.
+def _stats_line(msg: dict) -> str:
+    return (
+        f"{msg['row_count']} rows · {msg.get('latency_ms', 0):.0f}ms · "
+        f"tables: {msg.get('tables_used', [])}"
+    )
+
+
+def _turn_markdown(msg: dict) -> str:
+    if msg["role"] == "user":
+        return "> 👤 " + msg["content"].replace("\n", "\n> ")
+    parts = ["🤖 " + msg["content"]]
+    if msg.get("sql"):
+        parts.append(f"```sql\n{msg['sql']}\n```")
+        if msg.get("row_count") is not None:
+            parts.append(f"*{_stats_line(msg)}*")
+    parts.append("---")
+    return "\n\n".join(parts)
+
+
+history = st.session_state["messages"]
+# The latest exchange is the trailing assistant reply plus the question before it
+split   = max(len(history) - 2, 0)
+
+# One fixed slot for the folded history: only turns folded since the last rerun
+# are formatted, and the slot's position never shifts the widgets below it.
+history_slot  = st.empty()
+history_parts = st.session_state["history_parts"]
+while len(history_parts) < split:
+    history_parts.append(_turn_markdown(history[len(history_parts)]))
+if split:
+    history_slot.markdown("\n\n".join(history_parts[:split]))
+
+for msg in history[split:]:
     with st.chat_message(msg["role"]):
         st.markdown(msg["content"])
         # Show the generated SQL in a collapsible expander
@@ -144,10 +241,7 @@ for msg in st.session_state["messages"]:
             with st.expander("Show SQL"):
                 st.code(msg["sql"], language="sql")
             if msg.get("row_count") is not None:
-                st.caption(
-                    f"{msg['row_count']} rows · {msg.get('latency_ms', 0):.0f}ms · "
-                    f"tables: {msg.get('tables_used', [])}"
-                )
+                st.caption(_stats_line(msg))
 
 # ── Handle example question clicks from sidebar ───────────────────────────────
 # When a sidebar button is clicked, the question is stored in session_state.
@@ -161,7 +255,7 @@ user_input = st.chat_input("Ask a question about crypto markets...") or pending
 
 if user_input:
     # Append user message to history and display it
-    st.session_state["messages"].append({"role": "user", "content": user_input})
+    add_message({"role": "user", "content": user_input})
     with st.chat_message("user"):
         st.markdown(user_input)
 
@@ -184,7 +278,7 @@ if user_input:
                 )
 
                 # Save to chat history
-                st.session_state["messages"].append({
+                add_message({
                     "role":        "assistant",
                     "content":     result["answer"],
                     "sql":         result["sql"],
@@ -196,9 +290,9 @@ if user_input:
             except ValidationError as e:
                 msg = f"⚠️ {e}"
                 st.warning(msg)
-                st.session_state["messages"].append({"role": "assistant", "content": msg})
+                add_message({"role": "assistant", "content": msg})
 
             except Exception as e:
                 msg = f"❌ Error: {e}"
                 st.error(msg)
-                st.session_state["messages"].append({"role": "assistant", "content": msg})
+                add_message({"role": "assistant", "content": msg})
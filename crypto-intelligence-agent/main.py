@@ -22,13 +22,15 @@ Environment variables required:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
+from dataclasses import asdict
 from datetime import datetime, timezone
 
 from src.coinmarketcap_client import CoinMarketCapClient
-from src.transform import listings_to_parquet, global_metrics_to_parquet
+from src.transform import listings_pages_to_parquet
 from src.snowflake_loader import SnowflakeLoader
 
 logging.basicConfig(
@@ -59,43 +61,40 @@ def main() -> None:
 
     logger.info("Starting CoinMarketCap ETL — limit=%d  run_date=%s", args.limit, run_date)
 
-    client = CoinMarketCapClient(api_key=api_key)
     summary: dict[str, dict] = {}
 
-    with SnowflakeLoader() as loader:
+    with CoinMarketCapClient(api_key=api_key) as client, SnowflakeLoader() as loader:
 
         # ------------------------------------------------------------------
-        # Coin listings  (paginated — yields one batch per API call)
+        # Coin listings  (paginated — all pages requested concurrently)
         # ------------------------------------------------------------------
-        total_coins = 0
+        pages       = asyncio.run(client.listings_pages_async(limit=args.limit))
+        total_coins = sum(len(page) for page in pages)
 
-        for page_num, page in enumerate(client.listings_pages(limit=args.limit), start=1):
-            parquet_bytes = listings_to_parquet(page)
-            metrics       = loader.load_listings(
-                parquet_bytes = parquet_bytes,
-                run_date      = f"{run_date}_page{page_num:03d}",
-            )
-            total_coins  += len(page)
-            logger.info("Page %d: %d coins  %s", page_num, len(page), metrics)
+        # One Parquet file for every page → one PUT + one COPY for the run
+        metrics = loader.load_listings(
+            parquet_bytes = listings_pages_to_parquet(pages),
+            run_date      = run_date,
+        )
+        logger.info("Listings: %d coins in %d pages  %s", total_coins, len(pages), metrics)
 
-        summary["listings"] = {"coins_fetched": total_coins}
+        summary["listings"] = {"coins_fetched": total_coins, **metrics}
 
         # ------------------------------------------------------------------
-        # Global market metrics (single snapshot)
+        # Global market metrics (single snapshot — one bound MERGE, no stage)
         # ------------------------------------------------------------------
         if not args.no_global_metrics:
             metrics_snapshot  = client.global_metrics()
-            parquet_bytes     = global_metrics_to_parquet(metrics_snapshot)
-            metrics           = loader.load_global_metrics(
-                parquet_bytes = parquet_bytes,
-                run_date      = run_date,
-            )
+            metrics           = loader.load_global_metrics([asdict(metrics_snapshot)])
             summary["global_metrics"] = metrics
-            logger.info(
-                "Global metrics: BTC dominance=%.2f%%  total_mcap=$%.2fT",
-                metrics_snapshot.btc_dominance or 0,
-                (metrics_snapshot.total_market_cap_usd or 0) / 1e12,
-            )
+            # The arguments below are evaluated eagerly, so skip them entirely
+            # when INFO is suppressed
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Global metrics: BTC dominance=%.2f%%  total_mcap=$%.2fT",
+                    metrics_snapshot.btc_dominance or 0,
+                    (metrics_snapshot.total_market_cap_usd or 0) / 1e12,
+                )
 
     logger.info("ETL complete: %s", summary)
 
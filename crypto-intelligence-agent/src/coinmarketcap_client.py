@@ -11,18 +11,27 @@ Features:
   - API key injection via header (never in query params or logs)
   - Automatic retry with exponential back-off on 429 / 5xx
   - Pagination for listings endpoint (CMC caps at 5,000 per request)
-  - Structured dataclasses for type-safe downstream handling
+  - One persistent HTTP/2 connection pool, so TLS handshakes aren't repeated
+  - orjson decoding — listings pages are multi-MB and float-heavy
+  - Async listings fetch that requests every page concurrently
+  - Listings pages parsed straight into Arrow tables (no per-coin Python objects)
+  - Structured dataclass for the single-row global metrics snapshot
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from typing import Any, Generator
 
 import httpx
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +40,7 @@ logger = logging.getLogger(__name__)
 # Response dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoinListing:
     id:                     int
     name:                   str
@@ -57,7 +66,58 @@ class CoinListing:
     fetched_at:             str
 
 
-@dataclass
+# Column order of a parsed listings page, and the quote.<convert>.* keys that
+# map onto it. Pages are Arrow tables; CoinListing documents their shape.
+LISTING_COLUMNS = [f.name for f in fields(CoinListing)]
+
+_QUOTE_COLUMNS = {
+    "price":                    "price_usd",
+    "volume_24h":               "volume_24h_usd",
+    "volume_change_24h":        "volume_change_24h_pct",
+    "market_cap":               "market_cap_usd",
+    "market_cap_dominance":     "market_cap_dominance",
+    "fully_diluted_market_cap": "fully_diluted_market_cap",
+    "percent_change_1h":        "pct_change_1h",
+    "percent_change_24h":       "pct_change_24h",
+    "percent_change_7d":        "pct_change_7d",
+    "percent_change_30d":       "pct_change_30d",
+}
+
+# Top-level listing keys and their Arrow types, as read from the raw response
+_RAW_LISTING_FIELDS = [
+    pa.field("id",                 pa.int64()),
+    pa.field("name",               pa.string()),
+    pa.field("symbol",             pa.string()),
+    pa.field("slug",               pa.string()),
+    pa.field("cmc_rank",           pa.int32()),
+    pa.field("num_market_pairs",   pa.int32()),
+    pa.field("circulating_supply", pa.float64()),
+    pa.field("total_supply",       pa.float64()),
+    pa.field("max_supply",         pa.float64()),
+    pa.field("infinite_supply",    pa.bool_()),
+    pa.field("last_updated",       pa.string()),
+]
+
+# Output column → flattened source column ({convert} is filled in per call)
+_QUOTE_SOURCES   = {dst: f"quote.{{convert}}.{src}" for src, dst in _QUOTE_COLUMNS.items()}
+_LISTING_SOURCES = {name: _QUOTE_SOURCES.get(name, name) for name in LISTING_COLUMNS}
+
+
+@functools.lru_cache(maxsize=None)
+def _raw_listings_schema(convert: str) -> pa.Schema:
+    """Schema for a raw listings page; any other keys in the response are ignored."""
+    quote = pa.struct([pa.field(src, pa.float64()) for src in _QUOTE_COLUMNS])
+    return pa.schema(_RAW_LISTING_FIELDS + [pa.field("quote", pa.struct([pa.field(convert, quote)]))])
+
+
+# Fallbacks for keys CMC omits; nullable numeric fields stay null
+_LISTING_DEFAULTS = {
+    "name": "", "symbol": "", "slug": "", "cmc_rank": 0, "num_market_pairs": 0,
+    "infinite_supply": False, "last_updated": "",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class GlobalMetrics:
     total_market_cap_usd:       float | None
     total_volume_24h_usd:       float | None
@@ -80,15 +140,17 @@ class CoinMarketCapClient:
     Thin httpx-based client for the CoinMarketCap Pro API.
 
     Usage:
-        client = CoinMarketCapClient(api_key="cmc-key-here")
-        for page in client.listings_pages(limit=5000):
-            process(page)
-        metrics = client.global_metrics()
+        with CoinMarketCapClient(api_key="cmc-key-here") as client:
+            for page in client.listings_pages(limit=5000):
+                process(page)
+            metrics = client.global_metrics()
     """
 
-    BASE_URL       = "https://pro-api.coinmarketcap.com"
-    MAX_RETRIES    = 4
-    BACKOFF_BASE   = 2   # seconds; doubles on each retry
+    BASE_URL         = "https://pro-api.coinmarketcap.com"
+    LISTINGS_PATH    = "/v1/cryptocurrency/listings/latest"
+    MAX_RETRIES      = 4
+    BACKOFF_BASE     = 2   # seconds; doubles on each retry
+    MAX_CONNECTIONS  = 8   # concurrent page requests in listings_pages_async
 
     def __init__(self, api_key: str, timeout: float = 30.0) -> None:
         self._headers = {
@@ -96,6 +158,23 @@ class CoinMarketCapClient:
             "Accept":            "application/json",
         }
         self._timeout = timeout
+        # Reused across calls: keep-alive + HTTP/2 means one TLS handshake per run
+        self._client  = httpx.Client(
+            base_url = self.BASE_URL,
+            headers  = self._headers,
+            timeout  = timeout,
+            http2    = True,
+            limits   = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0),
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> "CoinMarketCapClient":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Public interface
@@ -106,46 +185,68 @@ class CoinMarketCapClient:
         limit: int        = 5000,
         convert: str      = "USD",
         page_size: int    = 1000,
-    ) -> Generator[list[CoinListing], None, None]:
+    ) -> Generator[pa.Table, None, None]:
         """
-        Yield pages of CoinListing objects for the top `limit` coins by market cap.
+        Yield pages (Arrow tables shaped like CoinListing) for the top `limit` coins by market cap.
 
         CMC's /listings/latest endpoint caps at 5,000 coins per call; this
         method handles pagination transparently so callers don't need to track
         start offsets.
         """
-        fetched = 0
-        start   = 1
-
-        while fetched < limit:
-            batch_size = min(page_size, limit - fetched)
-            raw = self._get(
-                "/v1/cryptocurrency/listings/latest",
-                params={
-                    "start":   start,
-                    "limit":   batch_size,
-                    "convert": convert,
-                    "aux":     "num_market_pairs,cmc_rank,max_supply,circulating_supply,"
-                               "total_supply,market_cap_by_total_supply,volume_24h_reported,"
-                               "infinite_supply",
-                },
-            )
+        for start, batch_size in self._page_ranges(limit, page_size):
+            raw = self._get(self.LISTINGS_PATH, params=self._listings_params(start, batch_size, convert))
 
             data = raw.get("data", [])
             if not data:
                 break
 
             fetched_at = datetime.now(timezone.utc).isoformat()
-            page = [self._parse_listing(coin, fetched_at, convert) for coin in data]
+            page = self._parse_listings(data, fetched_at, convert)
             logger.info("Listings page start=%d fetched=%d coins", start, len(page))
             yield page
 
-            fetched += len(data)
-            start   += len(data)
-
             if len(data) < batch_size:
                 break   # CMC returned fewer than requested — we've hit the end
 
+    async def listings_pages_async(
+        self,
+        limit: int        = 5000,
+        convert: str      = "USD",
+        page_size: int    = 1000,
+    ) -> list[pa.Table]:
+        """
+        Fetch every listings page concurrently and return them in rank order.
+
+        /listings/latest is offset-addressable, so all (start, limit) pairs are
+        known up front and no request depends on the previous response. Wall
+        time is roughly one round-trip instead of one per page.
+        """
+        offsets = self._page_ranges(limit, page_size)
+
+        async with httpx.AsyncClient(
+            base_url = self.BASE_URL,
+            headers  = self._headers,
+            timeout  = self._timeout,
+            http2    = True,
+            limits   = httpx.Limits(max_connections=self.MAX_CONNECTIONS),
+        ) as client:
+            responses = await asyncio.gather(*[
+                self._aget(client, self.LISTINGS_PATH, self._listings_params(start, size, convert))
+                for start, size in offsets
+            ])
+
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        pages: list[pa.Table] = []
+        for (start, size), raw in zip(offsets, responses):
+            data = raw.get("data", [])
+            if not data:
+                break
+            pages.append(self._parse_listings(data, fetched_at, convert))
+            logger.info("Listings page start=%d fetched=%d coins", start, len(data))
+            if len(data) < size:
+                break   # CMC returned fewer than requested — we've hit the end
+        return pages
+
     def global_metrics(self, convert: str = "USD") -> GlobalMetrics:
         """Fetch a single GlobalMetrics snapshot."""
         raw = self._get(
@@ -158,69 +259,105 @@ class CoinMarketCapClient:
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _page_ranges(limit: int, page_size: int) -> list[tuple[int, int]]:
+        """(start, batch_size) for every page — CMC offsets are 1-based and fixed up front."""
+        return [(start, min(page_size, limit - start + 1)) for start in range(1, limit + 1, page_size)]
+
+    @staticmethod
+    def _listings_params(start: int, batch_size: int, convert: str) -> dict[str, Any]:
+        return {
+            "start":   start,
+            "limit":   batch_size,
+            "convert": convert,
+            "aux":     "num_market_pairs,cmc_rank,max_supply,circulating_supply,"
+                       "total_supply,market_cap_by_total_supply,volume_24h_reported,"
+                       "infinite_supply",
+        }
+
+    def _retry_wait(self, resp: httpx.Response, attempt: int) -> int:
+        """
+        Seconds to wait before retrying `resp`, shared by the sync and async paths.
+
+        Raises immediately on a non-retryable 4xx.
+        """
+        if resp.status_code == 429:
+            # Rate limited — honour Retry-After header if present
+            retry_after = int(resp.headers.get("Retry-After", self.BACKOFF_BASE ** attempt))
+            logger.warning("Rate limited (429). Waiting %ds before retry %d/%d",
+                           retry_after, attempt, self.MAX_RETRIES)
+            return retry_after
+
+        if resp.status_code >= 500:
+            wait = self.BACKOFF_BASE ** attempt
+            logger.warning("Server error %d. Retry %d/%d in %ds",
+                           resp.status_code, attempt, self.MAX_RETRIES, wait)
+            return wait
+
+        resp.raise_for_status()   # 4xx (not 429) — fail immediately
+        return 0   # unexpected 2xx/3xx — retry straight away
+
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Execute a GET request with retry / back-off logic."""
-        url = f"{self.BASE_URL}{path}"
-
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                with httpx.Client(timeout=self._timeout) as client:
-                    resp = client.get(url, headers=self._headers, params=params)
+                resp = self._client.get(path, params=params)
 
                 if resp.status_code == 200:
-                    return resp.json()
+                    return orjson.loads(resp.content)
 
-                if resp.status_code == 429:
-                    # Rate limited — honour Retry-After header if present
-                    retry_after = int(resp.headers.get("Retry-After", self.BACKOFF_BASE ** attempt))
-                    logger.warning("Rate limited (429). Waiting %ds before retry %d/%d",
-                                   retry_after, attempt, self.MAX_RETRIES)
-                    time.sleep(retry_after)
-                    continue
+                time.sleep(self._retry_wait(resp, attempt))
 
-                if resp.status_code >= 500:
-                    wait = self.BACKOFF_BASE ** attempt
-                    logger.warning("Server error %d. Retry %d/%d in %ds",
-                                   resp.status_code, attempt, self.MAX_RETRIES, wait)
-                    time.sleep(wait)
-                    continue
+            except httpx.TimeoutException:
+                wait = self.BACKOFF_BASE ** attempt
+                logger.warning("Request timeout. Retry %d/%d in %ds", attempt, self.MAX_RETRIES, wait)
+                time.sleep(wait)
 
-                resp.raise_for_status()   # 4xx (not 429) — fail immediately
+        raise RuntimeError(f"CoinMarketCap API call failed after {self.MAX_RETRIES} retries: {path}")
+
+    async def _aget(
+        self,
+        client: httpx.AsyncClient,
+        path:   str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async counterpart of _get; same retry / back-off policy."""
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            try:
+                resp = await client.get(path, params=params)
+
+                if resp.status_code == 200:
+                    return orjson.loads(resp.content)
+
+                await asyncio.sleep(self._retry_wait(resp, attempt))
 
             except httpx.TimeoutException:
                 wait = self.BACKOFF_BASE ** attempt
                 logger.warning("Request timeout. Retry %d/%d in %ds", attempt, self.MAX_RETRIES, wait)
-                time.sleep(wait)
+                await asyncio.sleep(wait)
 
         raise RuntimeError(f"CoinMarketCap API call failed after {self.MAX_RETRIES} retries: {path}")
 
     @staticmethod
-    def _parse_listing(coin: dict, fetched_at: str, convert: str) -> CoinListing:
-        quote = coin.get("quote", {}).get(convert, {})
-        return CoinListing(
-            id                        = coin["id"],
-            name                      = coin.get("name", ""),
-            symbol                    = coin.get("symbol", ""),
-            slug                      = coin.get("slug", ""),
-            cmc_rank                  = coin.get("cmc_rank", 0),
-            num_market_pairs          = coin.get("num_market_pairs", 0),
-            circulating_supply        = coin.get("circulating_supply"),
-            total_supply              = coin.get("total_supply"),
-            max_supply                = coin.get("max_supply"),
-            infinite_supply           = coin.get("infinite_supply", False),
-            price_usd                 = quote.get("price"),
-            volume_24h_usd            = quote.get("volume_24h"),
-            volume_change_24h_pct     = quote.get("volume_change_24h"),
-            market_cap_usd            = quote.get("market_cap"),
-            market_cap_dominance      = quote.get("market_cap_dominance"),
-            fully_diluted_market_cap  = quote.get("fully_diluted_market_cap"),
-            pct_change_1h             = quote.get("percent_change_1h"),
-            pct_change_24h            = quote.get("percent_change_24h"),
-            pct_change_7d             = quote.get("percent_change_7d"),
-            pct_change_30d            = quote.get("percent_change_30d"),
-            last_updated              = coin.get("last_updated", ""),
-            fetched_at                = fetched_at,
-        )
+    def _parse_listings(data: list[dict], fetched_at: str, convert: str) -> pa.Table:
+        """
+        Convert a page of raw listings into an Arrow table with CoinListing's columns.
+
+        pyarrow walks the nested dicts (including quote.<convert>.*) in C and
+        stores numbers in contiguous buffers — no per-coin Python objects or
+        boxed floats. Table.flatten() respects a missing quote (nulls, not junk).
+        """
+        raw  = pa.Table.from_pylist(data, schema=_raw_listings_schema(convert)).flatten().flatten()
+        cols = {}
+        for name, src in _LISTING_SOURCES.items():
+            if name == "fetched_at":
+                col = pa.array([fetched_at] * raw.num_rows, pa.string())
+            else:
+                col = raw.column(src.format(convert=convert))
+            if name in _LISTING_DEFAULTS:
+                col = pc.fill_null(col, _LISTING_DEFAULTS[name])
+            cols[name] = col
+        return pa.table(cols)
 
     @staticmethod
     def _parse_global_metrics(data: dict, convert: str) -> GlobalMetrics:
@@ -4,11 +4,17 @@ snowflake_loader.py
 Loads Parquet files from a local buffer into Snowflake using the
 stage-and-merge pattern:
 
-  1. PUT Parquet bytes to a named internal stage (@crypto_stage)
+  1. PUT Parquet bytes to a named internal stage (@crypto_stage), streamed
+     straight from memory — nothing is written to local disk
   2. COPY INTO a staging table from the stage
-  3. MERGE from staging table into target table (idempotent upsert)
+  3. MERGE from staging table into target table (idempotent upsert), or for
+     append-only snapshots an INSERT … WHERE NOT EXISTS anti-join
   4. TRUNCATE the staging table (keep it clean for next run)
 
+Steps 2–4 go to Snowflake as a single multi-statement request. Single-row
+snapshots (global metrics) skip the stage entirely: their values are bound
+into one MERGE.
+
 Why stage-and-merge over write_pandas?
   - COPY INTO is the fastest Snowflake ingest path — parallelised server-side
   - MERGE makes the load idempotent: re-running won't create duplicates
@@ -17,11 +23,11 @@ Why stage-and-merge over write_pandas?
 
 from __future__ import annotations
 
-import io
 import logging
 import os
-import tempfile
+from typing import Any, Sequence
 
+import pyarrow as pa
 import snowflake.connector
 from snowflake.connector import DictCursor
 
@@ -62,16 +68,27 @@ class SnowflakeLoader:
     # Public interface
     # ------------------------------------------------------------------
 
-    def load_listings(self, parquet_bytes: bytes, run_date: str) -> dict[str, int]:
+    def load_listings(
+        self,
+        parquet_bytes: pa.Buffer,
+        run_date:      str,
+        upsert:        bool = False,
+    ) -> dict[str, int]:
         """
-        Upsert a batch of coin listing snapshots.
-
-        Merge key: (cmc_id, fetched_at) — allows multiple snapshots per day
-        while preventing exact duplicates on re-runs.
+        Load one run's coin listing snapshots, written as a single Parquet file
+        by listings_pages_to_parquet: one PUT, then one COPY + load statement.
+
+        Key: (cmc_id, fetched_at) — allows multiple snapshots per day while
+        preventing exact duplicates on re-runs. Every run stamps a fresh
+        fetched_at, so by default rows are appended with an anti-join
+        (INSERT … WHERE NOT EXISTS) instead of a MERGE, which would join against
+        the whole target just to take its NOT MATCHED branch. Pass upsert=True
+        to MERGE instead when re-loading a snapshot whose values changed.
         """
         return self._stage_and_merge(
+            file_name     = "listings.parquet",
             parquet_bytes = parquet_bytes,
-            stage_file    = f"listings_{run_date}.parquet",
+            stage_prefix  = f"listings_{run_date}",
             stage_table   = "CMC_LISTINGS_STAGE",
             target_table  = "CMC_LISTINGS",
             merge_keys    = ["id", "fetched_at"],
@@ -81,14 +98,18 @@ class SnowflakeLoader:
                 "pct_change_1h", "pct_change_24h", "pct_change_7d", "pct_change_30d",
                 "circulating_supply", "total_supply",
             ],
+            append_only   = not upsert,
         )
 
-    def load_global_metrics(self, parquet_bytes: bytes, run_date: str) -> dict[str, int]:
-        """Upsert the global market metrics snapshot."""
-        return self._stage_and_merge(
-            parquet_bytes = parquet_bytes,
-            stage_file    = f"global_metrics_{run_date}.parquet",
-            stage_table   = "CMC_GLOBAL_METRICS_STAGE",
+    def load_global_metrics(self, rows: Sequence[dict[str, Any]]) -> dict[str, int]:
+        """
+        Upsert the global market metrics snapshot (one row per run).
+
+        A single row doesn't justify PUT + COPY + staging table: the values are
+        bound straight into one MERGE, so the whole load is one round-trip.
+        """
+        return self._merge_rows(
+            rows          = rows,
             target_table  = "CMC_GLOBAL_METRICS",
             merge_keys    = ["fetched_at"],
             update_cols   = [
@@ -99,70 +120,131 @@ class SnowflakeLoader:
         )
 
     # ------------------------------------------------------------------
-    # Core stage-and-merge implementation
+    # Small-payload path: bound-parameter MERGE, no stage
     # ------------------------------------------------------------------
 
-    def _stage_and_merge(
+    def _merge_rows(
         self,
-        parquet_bytes: bytes,
-        stage_file:    str,
-        stage_table:   str,
+        rows:          Sequence[dict[str, Any]],
         target_table:  str,
         merge_keys:    list[str],
         update_cols:   list[str],
     ) -> dict[str, int]:
+        if not rows:
+            return {"rows_inserted": 0, "rows_updated": 0}
 
-        cur = self._conn.cursor(DictCursor)
+        cols          = list(rows[0])
+        row_values    = "(" + ", ".join(["%s"] * len(cols)) + ")"
+        src_cols      = ", ".join(f"column{i} AS {c}" for i, c in enumerate(cols, start=1))
+        on_clause     = " AND ".join(f"tgt.{k} = src.{k}" for k in merge_keys)
+        update_clause = ", ".join(f"tgt.{c} = src.{c}" for c in update_cols)
 
-        try:
-            # 1. Write Parquet bytes to a temp file and PUT to Snowflake stage
-            with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                tmp.write(parquet_bytes)
-                tmp_path = tmp.name
+        with self._conn.cursor(DictCursor) as cur:
+            result = cur.execute(f"""
+                MERGE INTO {target_table} AS tgt
+                USING (
+                    SELECT {src_cols}
+                    FROM VALUES {", ".join([row_values] * len(rows))}
+                ) AS src
+                ON {on_clause}
+                WHEN MATCHED THEN
+                    UPDATE SET {update_clause}
+                WHEN NOT MATCHED THEN
+                    INSERT ({", ".join(cols)})
+                    VALUES ({", ".join(f"src.{c}" for c in cols)})
+            """, [row[c] for row in rows for c in cols]).fetchone()
+
+        rows_inserted = result.get("number of rows inserted", 0) if result else 0
+        rows_updated  = result.get("number of rows updated",  0) if result else 0
+
+        metrics = {"rows_inserted": rows_inserted, "rows_updated": rows_updated}
+        logger.info("Loaded %s → %s", target_table, metrics)
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Core stage-and-merge implementation
+    # ------------------------------------------------------------------
 
-            logger.info("PUT %s → @crypto_stage/%s", tmp_path, stage_file)
+    def _put(self, stage_prefix: str, file_name: str, parquet_bytes: pa.Buffer) -> None:
+        """PUT one in-memory file to the stage."""
+        logger.info("PUT <%d bytes> → @crypto_stage/%s/%s",
+                    len(parquet_bytes), stage_prefix, file_name)
+        with self._conn.cursor() as cur:
             cur.execute(
-                f"PUT file://{tmp_path} @crypto_stage/{stage_file} "
-                f"AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+                f"PUT file://{file_name} @crypto_stage/{stage_prefix}/ "
+                f"AUTO_COMPRESS=FALSE OVERWRITE=TRUE",
+                # BufferReader reads the Arrow buffer in place (BytesIO would copy it)
+                file_stream=pa.BufferReader(parquet_bytes),
             )
 
-            # 2. COPY into staging table
-            logger.info("COPY INTO %s", stage_table)
-            cur.execute(f"""
-                COPY INTO {stage_table}
-                FROM @crypto_stage/{stage_file}
-                FILE_FORMAT = (TYPE = 'PARQUET' SNAPPY_COMPRESSION = TRUE)
-                MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
-                PURGE = TRUE
-            """)
+    def _stage_and_merge(
+        self,
+        file_name:     str,
+        parquet_bytes: pa.Buffer,
+        stage_prefix:  str,
+        stage_table:   str,
+        target_table:  str,
+        merge_keys:    list[str],
+        update_cols:   list[str],
+        append_only:   bool = False,
+    ) -> dict[str, int]:
 
-            # 3. MERGE into target
+        cur = self._conn.cursor(DictCursor)
+
+        try:
+            # 1. Stream the Parquet file to the Snowflake stage.
+            #    With file_stream the file:// path only names the staged file;
+            #    nothing is read from disk. AUTO_COMPRESS stays off: Parquet pages
+            #    are already Zstd-compressed.
+            self._put(stage_prefix, file_name, parquet_bytes)
+
+            # 2–4. COPY the file under the prefix into the staging table, load
+            #      into the target and TRUNCATE the staging table — sent as ONE
+            #      multi-statement request, so three statements cost one round-trip.
             on_clause      = " AND ".join(f"tgt.{k} = src.{k}" for k in merge_keys)
-            update_clause  = ", ".join(f"tgt.{c} = src.{c}" for c in update_cols)
 
-            result = cur.execute(f"""
+            if append_only:
+                load_sql = f"""
+                INSERT INTO {target_table}
+                SELECT * FROM {stage_table} AS src
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {target_table} AS tgt WHERE {on_clause}
+                )"""
+            else:
+                update_clause = ", ".join(f"tgt.{c} = src.{c}" for c in update_cols)
+                load_sql = f"""
                 MERGE INTO {target_table} AS tgt
                 USING {stage_table}       AS src
                 ON {on_clause}
                 WHEN MATCHED THEN
                     UPDATE SET {update_clause}
                 WHEN NOT MATCHED THEN
-                    INSERT SELECT *
-            """).fetchone()
+                    INSERT SELECT *"""
+
+            logger.info("COPY INTO %s (%s) → %s %s", stage_table, file_name,
+                        "INSERT INTO" if append_only else "MERGE INTO", target_table)
+            cur.execute(f"""
+                COPY INTO {stage_table}
+                FROM @crypto_stage/{stage_prefix}/
+                FILE_FORMAT = (TYPE = 'PARQUET' USE_LOGICAL_TYPE = TRUE)
+                MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+                PURGE = TRUE;
+
+                {load_sql};
+
+                TRUNCATE TABLE {stage_table};
+            """, num_statements=3)
+
+            # The cursor starts on the COPY result; the load counts are the next set
+            cur.nextset()
+            result = cur.fetchone()
 
             rows_inserted = result.get("number of rows inserted", 0) if result else 0
             rows_updated  = result.get("number of rows updated",  0) if result else 0
 
-            # 4. Truncate staging table for next run
-            cur.execute(f"TRUNCATE TABLE {stage_table}")
-
             metrics = {"rows_inserted": rows_inserted, "rows_updated": rows_updated}
             logger.info("Loaded %s → %s", target_table, metrics)
             return metrics
 
         finally:
             cur.close()
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
@@ -12,15 +12,23 @@ is included.
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
+import xxhash
 from prefect import flow, task, get_run_logger
 from prefect.states import Failed
+from prefect.task_runners import ConcurrentTaskRunner
 from prefect_gcp import GcsBucket
 from prefect_gcp.secret_manager import GcpSecret
 from pydantic import Field
@@ -42,6 +50,7 @@ class GitHubFlowSettings(BaseSettings):
     )
     pr_page_size: int         = 100
     lookback_days: int        = 3     # How many days to look back for updates
+    pr_file_rows: int         = 50_000  # Rows per Parquet file; COPY loads files in parallel
 
     @property
     def is_prod(self) -> bool:
@@ -51,10 +60,46 @@ class GitHubFlowSettings(BaseSettings):
 settings = GitHubFlowSettings()
 
 
+# Block documents only change when edited in Prefect, so each is loaded once
+# per process rather than by every task run (one API round trip per org).
+# The token itself is still read from the secret at the start of each run.
+@functools.lru_cache(maxsize=None)
+def _gcs_bucket(block_name: str) -> GcsBucket:
+    return GcsBucket.load(block_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _gcp_secret(block_name: str) -> GcpSecret:
+    return GcpSecret.load(block_name)
+
+
 # ---------------------------------------------------------------------------
 # Tasks — Extract
 # ---------------------------------------------------------------------------
 
+# Headers every GitHub request sends; callers add Authorization
+_GITHUB_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+# PR list page URL (minus the moving `since`) → (ETag, page, Link header) from
+# its last 200 response. Process-local: a long-running worker serving the
+# flow on a schedule revalidates pages instead of re-downloading them.
+# Bounded LRU so a worker serving many orgs doesn't grow it without limit.
+# Every org's fetch_pull_requests runs on its own ConcurrentTaskRunner thread,
+# so all access goes through _PAGE_ETAGS_LOCK.
+_PAGE_ETAGS: OrderedDict[str, tuple[str, list[dict[str, Any]], str]] = OrderedDict()
+_PAGE_ETAGS_MAX = 1024
+_PAGE_ETAGS_LOCK = threading.Lock()
+
+
+def _etag_key(url: str) -> str:
+    # `since` shifts every run, but GitHub only answers 304 when the current
+    # body matches the ETag sent, so dropping it from the key is safe
+    return str(httpx.URL(url).copy_remove_param("since"))
+
+
 @task(retries=3, retry_delay_seconds=60)
 def fetch_pull_requests(
     github_token: str,
@@ -77,161 +122,374 @@ def fetch_pull_requests(
     logger = get_run_logger()
     logger.info("Fetching PRs for org=%s since=%s", org, since.isoformat())
 
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+    headers = {**_GITHUB_HEADERS, "Authorization": f"Bearer {github_token}"}
+
+    # GitHub's own timestamp format (UTC, second precision, "Z"), so the
+    # stop check below is a plain string compare of like with like
+    since_iso = since.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     prs: list[dict] = []
-    url: str | None = (
-        f"{settings.github_api_base_url}/orgs/{org}/pulls"
-        f"?state=all&sort=updated&direction=desc"
-        f"&per_page={settings.pr_page_size}"
-        f"&since={since.isoformat()}"
-    )
+    url: str | None = str(httpx.URL(
+        f"{settings.github_api_base_url}/orgs/{org}/pulls",
+        params={
+            "state":     "all",
+            "sort":      "updated",
+            "direction": "desc",
+            "per_page":  settings.pr_page_size,
+            "since":     since_iso,
+        },
+    ))
 
     with httpx.Client(timeout=30.0) as client:
         while url:
-            resp = client.get(url, headers=headers)
-            resp.raise_for_status()
-            page = resp.json()
+            # Conditional request: an unchanged page comes back as a bodyless
+            # 304, which also doesn't count against the GitHub rate limit
+            key = _etag_key(url)
+            with _PAGE_ETAGS_LOCK:
+                cached = _PAGE_ETAGS.get(key)
+            resp = client.get(
+                url, headers={**headers, "If-None-Match": cached[0]} if cached else headers,
+            )
+            if resp.status_code == 304 and cached:
+                _, page, links = cached
+                with _PAGE_ETAGS_LOCK:
+                    # Another org's fetch may have evicted it since the get
+                    if key in _PAGE_ETAGS:
+                        _PAGE_ETAGS.move_to_end(key)
+            else:
+                resp.raise_for_status()
+                page  = orjson.loads(resp.content)
+                links = resp.headers.get("Link", "")
+                if etag := resp.headers.get("ETag"):
+                    with _PAGE_ETAGS_LOCK:
+                        _PAGE_ETAGS[key] = (etag, page, links)
+                        _PAGE_ETAGS.move_to_end(key)
+                        if len(_PAGE_ETAGS) > _PAGE_ETAGS_MAX:
+                            _PAGE_ETAGS.popitem(last=False)
             prs.extend(page)
 
             # Stop if we've fetched beyond the lookback window
-            if page and page[-1].get("updated_at", "") < since.isoformat():
+            if page and page[-1].get("updated_at", "") < since_iso:
                 break
 
-            # Follow GitHub Link header pagination
-            links = resp.headers.get("Link", "")
+            # Follow GitHub Link header pagination. A Link header replayed
+            # from the cache carries the `since` of the run that stored it,
+            # so pin the next page to this run's window
             next_link = None
             for part in links.split(","):
                 if 'rel="next"' in part:
                     next_link = part.split(";")[0].strip().strip("<>")
-            url = next_link
+            url = next_link and str(httpx.URL(next_link).copy_set_param("since", since_iso))
 
     logger.info("Fetched %d PRs for org=%s", len(prs), org)
     return prs
 
 
-@task(retries=2, retry_delay_seconds=30)
-def fetch_pr_reviews(
-    github_token: str,
-    org: str,
-    repo: str,
-    pr_number: int,
-) -> list[dict[str, Any]]:
-    """Fetch all reviews for a single pull request."""
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github+json",
-    }
-    with httpx.Client(timeout=20.0) as client:
-        resp = client.get(
-            f"{settings.github_api_base_url}/repos/{org}/{repo}/pulls/{pr_number}/reviews",
-            headers=headers,
-            params={"per_page": 100},
+@functools.lru_cache(maxsize=1)
+def _github_client() -> tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    """
+    Shared HTTP/2 client for the PR detail requests.
+
+    Every fetch_pr_details_batch call reuses its pooled connections instead
+    of paying a TCP + TLS handshake per batch, and concurrent task runs
+    multiplex over the same HTTP/2 connections. The client lives on a
+    dedicated background event loop so synchronous tasks can share it.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="github-http", daemon=True).start()
+    client = httpx.AsyncClient(
+        http2=True,
+        timeout=20.0,
+        limits=httpx.Limits(max_connections=50),
+        headers=_GITHUB_HEADERS,
+    )
+    return loop, client
+
+
+def _post_graphql(github_token: str, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    """POST a GraphQL query on the shared client and return its `data` object."""
+    loop, client = _github_client()
+
+    async def post() -> bytes:
+        resp = await client.post(
+            f"{settings.github_api_base_url}/graphql",
+            headers={"Authorization": f"Bearer {github_token}"},
+            content=orjson.dumps({"query": query, "variables": variables}),
         )
         resp.raise_for_status()
-        return resp.json()
+        return resp.content
+
+    body = orjson.loads(asyncio.run_coroutine_threadsafe(post(), loop).result())
+    # GraphQL reports query errors in a 200 body; a null PR (deleted, or a
+    # bad number) comes back as a partial result and is dropped by the caller
+    if body.get("data") is None:
+        raise RuntimeError(f"GitHub GraphQL query failed: {body.get('errors')}")
+    return body["data"]
+
+
+# Most PRs GitHub will resolve in one GraphQL request
+PR_DETAILS_BATCH_SIZE = 100
+
+# Review and changed-file fields selected for each PR (first 100 of each)
+_PR_DETAILS_FIELDS = """
+    number
+    reviews(first: 100) { nodes { databaseId state submittedAt author { login } } }
+    files(first: 100) { nodes { path additions deletions changeType } }
+"""
 
 
 @task(retries=2, retry_delay_seconds=30)
-def fetch_pr_files(
+def fetch_pr_details_batch(
     github_token: str,
     org: str,
     repo: str,
-    pr_number: int,
-) -> list[dict[str, Any]]:
-    """Fetch all changed files for a single pull request."""
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github+json",
+    pr_numbers: list[int],
+) -> dict[int, dict[str, list[dict[str, Any]]]]:
+    """
+    Fetch reviews and changed files for up to PR_DETAILS_BATCH_SIZE pull
+    requests of one repo in a single GraphQL request, where the REST API
+    needs two calls per PR. Map it over chunks of a repo's PR numbers.
+
+    Returns:
+        {pr_number: {"reviews": [...], "files": [...]}} for every PR found.
+    """
+    if len(pr_numbers) > PR_DETAILS_BATCH_SIZE:
+        raise ValueError(f"At most {PR_DETAILS_BATCH_SIZE} PRs per batch, got {len(pr_numbers)}")
+
+    # One aliased pullRequest field per number (GraphQL has no list lookup)
+    aliases = "\n".join(
+        f"pr{int(n)}: pullRequest(number: {int(n)}) {{{_PR_DETAILS_FIELDS}}}" for n in pr_numbers
+    )
+    query = (
+        "query($owner: String!, $repo: String!) {\n"
+        f"  repository(owner: $owner, name: $repo) {{\n{aliases}\n  }}\n"
+        "}"
+    )
+    repository = _post_graphql(github_token, query, {"owner": org, "repo": repo})["repository"] or {}
+    return {
+        pr["number"]: {"reviews": pr["reviews"]["nodes"], "files": pr["files"]["nodes"]}
+        for pr in repository.values()
+        if pr
     }
-    with httpx.Client(timeout=20.0) as client:
-        resp = client.get(
-            f"{settings.github_api_base_url}/repos/{org}/{repo}/pulls/{pr_number}/files",
-            headers=headers,
-            params={"per_page": 100},
-        )
-        resp.raise_for_status()
-        return resp.json()
 
 
 # ---------------------------------------------------------------------------
 # Tasks — Transform
 # ---------------------------------------------------------------------------
 
+PR_SCHEMA = pa.schema([
+    ("id",               pa.string()),
+    ("number",           pa.int64()),
+    ("org",              pa.string()),
+    ("repo_name",        pa.string()),
+    ("repo_id",          pa.string()),
+    ("title",            pa.string()),
+    ("url",              pa.string()),
+    ("state",            pa.string()),
+    ("base_ref",         pa.string()),
+    ("head_ref",         pa.string()),
+    ("base_sha",         pa.string()),
+    ("head_sha",         pa.string()),
+    ("merge_commit_sha", pa.string()),
+    ("user_login",       pa.string()),
+    ("is_merged",        pa.bool_()),
+    ("is_draft",         pa.bool_()),
+    ("auto_merge",       pa.bool_()),
+    ("created_at",       pa.string()),
+    ("updated_at",       pa.string()),
+    ("merged_at",        pa.string()),
+    ("closed_at",        pa.string()),
+    ("_row_key",         pa.uint64()),   # xxh3_64(org|repo|pr_id) → NUMBER(20,0)
+    ("_fivetran_synced", pa.string()),
+])
+
+
+# The subset of GitHub's PR payload the transform reads; other keys are ignored
+PR_RAW_SCHEMA = pa.schema([
+    ("id",               pa.int64()),
+    ("number",           pa.int64()),
+    ("title",            pa.string()),
+    ("html_url",         pa.string()),
+    ("state",            pa.string()),
+    ("merge_commit_sha", pa.string()),
+    ("merged",           pa.bool_()),
+    ("draft",            pa.bool_()),
+    ("auto_merge",       pa.struct([("merge_method", pa.string())])),
+    ("created_at",       pa.string()),
+    ("updated_at",       pa.string()),
+    ("merged_at",        pa.string()),
+    ("closed_at",        pa.string()),
+    ("user",             pa.struct([("login", pa.string())])),
+    ("base",             pa.struct([("ref", pa.string()), ("sha", pa.string())])),
+    ("head",             pa.struct([
+        ("ref",  pa.string()),
+        ("sha",  pa.string()),
+        ("repo", pa.struct([("id", pa.int64()), ("name", pa.string())])),
+    ])),
+])
+
+# PR_SCHEMA column → flattened PR_RAW_SCHEMA column, for fields that are only
+# renamed. Nested ones default to "" when their parent object is null (e.g.
+# head.repo on a PR from a deleted fork).
+_PR_COLUMNS = {
+    "title":            "title",
+    "url":              "html_url",
+    "state":            "state",
+    "merge_commit_sha": "merge_commit_sha",
+    "created_at":       "created_at",
+    "updated_at":       "updated_at",
+    "merged_at":        "merged_at",
+    "closed_at":        "closed_at",
+}
+_PR_NESTED_COLUMNS = {
+    "repo_name":  "head.repo.name",
+    "base_ref":   "base.ref",
+    "head_ref":   "head.ref",
+    "base_sha":   "base.sha",
+    "head_sha":   "head.sha",
+    "user_login": "user.login",
+}
+
+
+def _pr_table(raw_prs: list[dict[str, Any]], org: str) -> pa.Table:
+    """
+    Normalise raw PR records to the canonical schema.
+
+    Extracts nested objects (user, head, base), computes derived fields
+    (is_merged, is_draft), and adds a surrogate row key.
+    """
+    # Arrow walks the nested dicts in C against an explicit schema; every
+    # column after that is one kernel call. Only the row-key hash is per-PR.
+    raw  = pa.Table.from_pylist(raw_prs, schema=PR_RAW_SCHEMA)
+    flat = raw.flatten().flatten()
+    rows = raw.num_rows
+    ids  = pc.fill_null(pc.cast(flat["id"], pa.string()), "")
+
+    cols: dict[str, Any] = {name: flat[src] for name, src in _PR_COLUMNS.items()}
+    cols.update({name: pc.fill_null(flat[src], "") for name, src in _PR_NESTED_COLUMNS.items()})
+    row_keys = pc.binary_join_element_wise(org, cols["repo_name"], ids, "|").cast(pa.binary())
+    cols.update(
+        id=ids,
+        number=pc.fill_null(flat["number"], 0),
+        org=pa.repeat(pa.scalar(org), rows),
+        repo_id=pc.fill_null(pc.cast(flat["head.repo.id"], pa.string()), ""),
+        is_merged=pc.fill_null(flat["merged"], False),
+        is_draft=pc.fill_null(flat["draft"], False),
+        auto_merge=pc.is_valid(raw["auto_merge"]),
+        _row_key=pa.array([xxhash.xxh3_64_intdigest(key) for key in row_keys.to_pylist()], pa.uint64()),
+        # one sync timestamp for the batch
+        _fivetran_synced=pa.repeat(pa.scalar(datetime.utcnow().isoformat()), rows),
+    )
+    return pa.table([cols[name] for name in PR_SCHEMA.names], schema=PR_SCHEMA)
+
+
 @task
-def transform_pull_requests(
+def write_pull_requests_to_gcs(
     raw_prs: list[dict[str, Any]],
     org: str,
-) -> bytes:
+    run_date: date,
+) -> list[str]:
     """
-    Normalise raw PR records to the canonical schema and serialise to Parquet.
+    Normalise raw PRs and write them as Parquet straight into GCS.
 
-    Extracts nested objects (user, head, base), computes derived fields
-    (is_merged, is_draft), and adds a surrogate row key.
+    Arrow streams the compressed pages into the object upload, so the files
+    are never held in memory as bytes objects or passed between tasks. The
+    org's rows are split into files of settings.pr_file_rows so the COPY can
+    spread them across the warehouse's nodes. Returns the gs:// URIs.
     """
     logger = get_run_logger()
+    gcs    = _gcs_bucket(settings.gcs_bucket_block)
+    fs     = _gcs_filesystem(gcs)
+    # Writing through Arrow bypasses GcsBucket's path resolution, so apply the
+    # block's bucket_folder here the way upload_from_file_object would
+    folder = (gcs.bucket_folder or "").strip("/")
+    prefix = f"github/pull_request/org={org}/date={run_date.isoformat()}"
+    if folder:
+        prefix = f"{folder}/{prefix}"
+
+    table = _pr_table(raw_prs, org)
+    step  = settings.pr_file_rows
+    uris: list[str] = []
+    for chunk, offset in enumerate(range(0, table.num_rows or 1, step)):
+        path = f"{prefix}/pull_request_{org}_{chunk:04d}.parquet"
+        pq.write_table(
+            table.slice(offset, step), f"{gcs.bucket}/{path}",
+            filesystem=fs,
+            # ZSTD-1 encodes about as fast as Snappy but packs the repetitive
+            # string columns (org, state, refs, logins) noticeably smaller
+            compression="zstd",
+            compression_level=1,
+            use_dictionary=True,
+            row_group_size=step,
+            # COPY INTO never reads column statistics
+            write_statistics=False,
+        )
+        uris.append(f"gs://{gcs.bucket}/{path}")
+    logger.info(
+        "Wrote %d PR records for org=%s → %d file(s) under gs://%s/%s",
+        table.num_rows, org, len(uris), gcs.bucket, prefix,
+    )
+    return uris
+
+
+def _gcs_filesystem(gcs: GcsBucket) -> pafs.GcsFileSystem:
+    """Arrow GCS filesystem authenticated as the GcsBucket block's service account."""
+    from google.auth.transport.requests import Request
 
-    rows = []
-    for pr in raw_prs:
-        repo_name = pr.get("head", {}).get("repo", {}).get("name", "")
-        pr_id = str(pr.get("id", ""))
-        rows.append({
-            "id":                  pr_id,
-            "number":              int(pr.get("number", 0)),
-            "org":                 org,
-            "repo_name":           repo_name,
-            "repo_id":             str(pr.get("head", {}).get("repo", {}).get("id", "")),
-            "title":               pr.get("title", ""),
-            "url":                 pr.get("html_url", ""),
-            "state":               pr.get("state", ""),
-            "base_ref":            pr.get("base", {}).get("ref", ""),
-            "head_ref":            pr.get("head", {}).get("ref", ""),
-            "base_sha":            pr.get("base", {}).get("sha", ""),
-            "head_sha":            pr.get("head", {}).get("sha", ""),
-            "merge_commit_sha":    pr.get("merge_commit_sha", ""),
-            "user_login":          pr.get("user", {}).get("login", ""),
-            "is_merged":           pr.get("merged", False),
-            "is_draft":            pr.get("draft", False),
-            "auto_merge":          pr.get("auto_merge") is not None,
-            "created_at":          pr.get("created_at", ""),
-            "updated_at":          pr.get("updated_at", ""),
-            "merged_at":           pr.get("merged_at", ""),
-            "closed_at":           pr.get("closed_at", ""),
-            "_row_key":            hashlib.md5(f"{org}|{repo_name}|{pr_id}".encode()).hexdigest(),
-            "_fivetran_synced":    datetime.utcnow().isoformat(),
-        })
-
-    table = pa.Table.from_pylist(rows)
-    buf   = pa.BufferOutputStream()
-    pq.write_table(table, buf)
-    logger.info("Serialised %d PR records for org=%s", len(rows), org)
-    return buf.getvalue().to_pybytes()
+    credentials = gcs.gcp_credentials.get_credentials_from_service_account()
+    credentials.refresh(Request())
+    return pafs.GcsFileSystem(
+        access_token=credentials.token,
+        credential_token_expiration=credentials.expiry,
+    )
 
 
 @task
-def upload_to_gcs(parquet_bytes: bytes, entity: str, org: str, run_date: date) -> str:
-    """Upload Parquet file to GCS with partitioned path."""
+def copy_to_snowflake(gcs_uris: list[str], target_table: str) -> dict[str, int]:
+    """
+    COPY every org's Parquet from GCS into Snowflake staging in one statement,
+    then MERGE into target once.
+    """
+    import os
+
     logger = get_run_logger()
-    gcs  = GcsBucket.load(settings.gcs_bucket_block)
-    path = f"github/{entity}/org={org}/date={run_date.isoformat()}/{entity}.parquet"
-    gcs.write_path(path=path, content=parquet_bytes)
-    uri  = f"gs://{gcs.bucket}/{path}"
-    logger.info("Uploaded %s → %s", entity, uri)
-    return uri
+    conn = _snowflake_conn(target_table)
+    if conn.is_closed():
+        _snowflake_conn.cache_clear()
+        conn = _snowflake_conn(target_table)
+    cur = conn.cursor()
+    stage_table = f"{target_table}_STAGE"
+
+    # One COPY over the files' common prefix; Snowflake loads the listed files
+    # in parallel, so there is nothing to gain from a COPY per org
+    prefix = os.path.commonprefix(gcs_uris).rsplit("/", 1)[0] + "/"
+    files = ", ".join(f"'{uri[len(prefix):]}'" for uri in gcs_uris)
+    # COPY, MERGE and TRUNCATE go up as one multi-statement request: one round
+    # trip, and a failed COPY aborts the rest before anything is merged
+    cur.execute(f"""
+        COPY INTO {stage_table} FROM '{prefix}' FILES=({files}) FILE_FORMAT=(TYPE='PARQUET');
+        MERGE INTO {target_table} AS tgt
+        USING {stage_table} AS src
+        ON tgt._row_key = src._row_key
+        WHEN MATCHED THEN UPDATE SET tgt._fivetran_synced = src._fivetran_synced
+        WHEN NOT MATCHED THEN INSERT SELECT *;
+        TRUNCATE TABLE {stage_table};
+    """, num_statements=3)
+    cur.nextset()                 # skip COPY's result set to MERGE's
+    result = cur.fetchone()
+    cur.close()
+    metrics = {"rows_inserted": result[0] if result else 0, "rows_updated": result[1] if result else 0}
+    logger.info("Merged %d file(s) into %s: %s", len(gcs_uris), target_table, metrics)
+    return metrics
 
 
-@task
-def copy_to_snowflake(gcs_uri: str, target_table: str) -> dict[str, int]:
-    """COPY Parquet from GCS into Snowflake staging, then MERGE into target."""
+@functools.lru_cache(maxsize=None)
+def _snowflake_conn(target_table: str):
+    """One Snowflake session per target table, reused across flow runs in this worker."""
     import os
     import snowflake.connector
 
-    logger = get_run_logger()
-    conn = snowflake.connector.connect(
+    return snowflake.connector.connect(
         account=os.environ["SNOWFLAKE_ACCOUNT"],
         user=os.environ["SNOWFLAKE_USER"],
         private_key_path=os.environ["SNOWFLAKE_PRIVATE_KEY_PATH"],
@@ -239,31 +497,34 @@ def copy_to_snowflake(gcs_uri: str, target_table: str) -> dict[str, int]:
         warehouse=os.environ.get("SNOWFLAKE_WAREHOUSE", "ETL__MEDIUM"),
         database="RAW",
         schema="GITHUB",
+        client_session_keep_alive=True,
         session_parameters={"QUERY_TAG": f"prefect:github_pr_ingestion:{target_table}"},
     )
-    cur = conn.cursor()
-    stage_table = f"{target_table}_STAGE"
-    cur.execute(f"COPY INTO {stage_table} FROM '{gcs_uri}' FILE_FORMAT=(TYPE='PARQUET')")
-    result = cur.execute(f"""
-        MERGE INTO {target_table} AS tgt
-        USING {stage_table} AS src
-        ON tgt._row_key = src._row_key
-        WHEN MATCHED THEN UPDATE SET tgt._fivetran_synced = src._fivetran_synced
-        WHEN NOT MATCHED THEN INSERT SELECT *
-    """).fetchone()
-    cur.execute(f"TRUNCATE TABLE {stage_table}")
+
+
+def backfill_row_key_map(target_table: str = "PULL_REQUEST") -> int:
+    """
+    One-off: fill {target_table}_ROW_KEY_MAP with the xxh3 key for every MD5
+    _row_key already in target_table (sql/snowflake_gcs_row_key_migration.sql).
+    Snowflake has no xxh3 function, so the keys are computed here from the same
+    org|repo_name|id input as _pr_table. Returns the number of keys mapped.
+    """
+    cur = _snowflake_conn(target_table).cursor()
+    rows = cur.execute(f"SELECT DISTINCT _row_key, org, repo_name, id FROM {target_table}").fetchall()
+    mapping = [
+        (old_key, xxhash.xxh3_64_intdigest(f"{org}|{repo_name or ''}|{pr_id or ''}".encode()))
+        for old_key, org, repo_name, pr_id in rows
+    ]
+    cur.executemany(f"INSERT INTO {target_table}_ROW_KEY_MAP (old_key, new_key) VALUES (%s, %s)", mapping)
     cur.close()
-    conn.close()
-    metrics = {"rows_inserted": result[0] if result else 0, "rows_updated": result[1] if result else 0}
-    logger.info("Merged into %s: %s", target_table, metrics)
-    return metrics
+    return len(mapping)
 
 
 # ---------------------------------------------------------------------------
 # Main flow
 # ---------------------------------------------------------------------------
 
-@flow(name="github-pr-ingestion")
+@flow(name="github-pr-ingestion", task_runner=ConcurrentTaskRunner())
 def github_pr_ingestion_flow(
     orgs: list[str] | None = None,
     lookback_days: int | None = None,
@@ -274,15 +535,17 @@ def github_pr_ingestion_flow(
     Steps:
     1. Load GitHub API token from GCP Secret Manager
     2. For each org: fetch PRs updated in the lookback window
-    3. Transform each batch to Parquet, upload to GCS
-    4. COPY + MERGE each entity into Snowflake
+    3. Transform each batch and write it to GCS as Parquet
+    4. COPY all orgs' files into Snowflake staging and MERGE once
+
+    Steps 2-3 run concurrently across orgs; step 4 runs once per flow run.
 
     Args:
         orgs: Override list of GitHub orgs (default: settings.github_orgs).
         lookback_days: Override lookback window (default: settings.lookback_days).
 
     Returns:
-        Summary dict with row counts per org.
+        Summary dict with row counts per org and the MERGE metrics.
     """
     logger = get_run_logger()
     active_orgs = orgs or settings.github_orgs
@@ -296,27 +559,45 @@ def github_pr_ingestion_flow(
     )
 
     try:
-        token = GcpSecret.load(settings.github_token_block).read_secret().decode("utf-8").strip()
+        token = _gcp_secret(settings.github_token_block).read_secret().decode("utf-8").strip()
     except Exception as exc:
         logger.error("Failed to load GitHub token: %s", exc)
         return Failed(message=str(exc))
 
     summary: dict[str, Any] = {}
 
+    # Submit every org's extract → transform/upload chain up front. Futures
+    # passed as arguments are resolved by Prefect, so each chain waits only on
+    # its own upstream tasks while the orgs run side by side.
+    staged: dict[str, tuple[Any, Any]] = {}
     for org in active_orgs:
+        raw_prs = fetch_pull_requests.submit(github_token=token, org=org, since=since)
+        pr_uris = write_pull_requests_to_gcs.submit(raw_prs=raw_prs, org=org, run_date=run_date)
+        staged[org] = (raw_prs, pr_uris)
+
+    # Every org's upload lands before a single COPY + MERGE: the orgs share
+    # PULL_REQUEST_STAGE, so one load for all of them replaces the per-org
+    # COPY → MERGE → TRUNCATE round trips
+    gcs_uris: list[str] = []
+    for org, (raw_prs, pr_uris) in staged.items():
         try:
-            raw_prs  = fetch_pull_requests(github_token=token, org=org, since=since)
-            pr_bytes = transform_pull_requests(raw_prs=raw_prs, org=org)
-            pr_uri   = upload_to_gcs(parquet_bytes=pr_bytes, entity="pull_request", org=org, run_date=run_date)
-            metrics  = copy_to_snowflake(gcs_uri=pr_uri, target_table="PULL_REQUEST")
-            summary[org] = {"prs_fetched": len(raw_prs), **metrics}
+            gcs_uris.extend(pr_uris.result())
+            summary[org] = {"prs_fetched": len(raw_prs.result())}
         except Exception as exc:
             logger.error("Org %s failed: %s", org, exc)
             summary[org] = {"error": str(exc)}
 
+    merge: dict[str, Any] = {}
+    if gcs_uris:
+        try:
+            merge = copy_to_snowflake(gcs_uris=gcs_uris, target_table="PULL_REQUEST")
+        except Exception as exc:
+            logger.error("Snowflake load failed: %s", exc)
+            merge = {"error": str(exc)}
+
     total = sum(v.get("prs_fetched", 0) for v in summary.values())
     logger.info("github-pr-ingestion complete. Total PRs: %d", total)
-    return {"orgs": summary, "total_prs": total, "run_date": run_date.isoformat()}
+    return {"orgs": summary, "merge": merge, "total_prs": total, "run_date": run_date.isoformat()}
 
 
 if __name__ == "__main__":
@@ -1,23 +1,30 @@
 """
 Prefect flow: github-pr-ingestion  ·  AWS variant
 ──────────────────────────────────────────────────────────────────────────────
-Functionally identical to github_pr_ingestion_flow.py (GCS variant).
-The only differences are the cloud storage and secrets layer:
+Same pipeline as github_pr_ingestion_flow.py (GCS variant): GitHub REST →
+Parquet in cloud storage → one COPY + MERGE into Snowflake per run.
+The cloud storage and secrets layer differ:
 
   GCS variant                         AWS variant (this file)
   ─────────────────────────────────   ─────────────────────────────────────
   prefect_gcp.GcsBucket               prefect_aws.S3Bucket
   prefect_gcp.secret_manager          prefect_aws.secrets_manager
     .GcpSecret                          .AwsSecret
-  gcs.write_path(path, content=b)     s3.upload_from_file_object(
-                                         BytesIO(b), to_path=path)
+  pq.write_table(table, path,         pq.ParquetWriter → S3FileSystem, page
+    filesystem=GcsFileSystem)           by page (stream_to_s3, the default)
+                                      or s3.upload_from_file_object(
+                                         pa.BufferReader(b), to_path=path)
   gs://bucket/path                    s3://bucket/path
   GCS external stage in Snowflake     S3 storage integration in Snowflake
   Service account key auth            IAM role trust policy auth (no keys)
 
-Everything else — GitHub API calls, PyArrow transform, Snowflake MERGE —
-is identical. See github_pr_ingestion_flow.py for inline comments on
-the shared logic.
+The two have also diverged past the storage layer:
+  - GCS walks the Link header page by page with ETag revalidation; AWS reads
+    the page count from rel="last" and fetches pages concurrently as Arrow
+  - GCS keeps GitHub's ISO timestamp strings and stamps _fivetran_synced;
+    AWS writes Parquet timestamps and stamps _ingested_at
+  - GCS's MERGE only refreshes _fivetran_synced on matched rows; AWS's
+    updates state and the timestamps when the staged row is newer
 
 Hypothetical showcase. All org names, tokens, and account IDs are generic.
 ──────────────────────────────────────────────────────────────────────────────
@@ -25,14 +32,19 @@ Hypothetical showcase. All org names, tokens, and account IDs are generic.
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import functools
+import threading
 from datetime import date, datetime, timedelta
-from io import BytesIO
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
 import httpx
+import orjson                                                      # pip install orjson
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
+import xxhash                                                      # pip install xxhash
 
 from prefect import flow, task, get_run_logger
 from prefect.states import Failed
@@ -40,6 +52,7 @@ from prefect.states import Failed
 # ── AWS-specific imports (replaces prefect_gcp) ──────────────────────────────
 from prefect_aws import S3Bucket                                   # pip install prefect-aws
 from prefect_aws.secrets_manager import AwsSecret                  # same package
+from boto3.s3.transfer import TransferConfig                       # boto3 ships with prefect-aws
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -61,6 +74,10 @@ class GitHubFlowSettings(BaseSettings):
         alias="GITHUB_ORGS",
     )
     pr_page_size: int         = 100
+    max_concurrent_pages: int = 16
+    # Stream each org's pages straight into an S3 Parquet file instead of
+    # building the whole file in memory first
+    stream_to_s3: bool        = True
     lookback_days: int        = 3
 
     @property
@@ -71,195 +88,452 @@ class GitHubFlowSettings(BaseSettings):
 settings = GitHubFlowSettings()
 
 
+# Block documents only change when someone edits them in Prefect, so each is
+# fetched from the API once per process instead of once per task call.
+# The secret value itself is still read fresh each run (token rotation).
+@functools.lru_cache(maxsize=None)
+def _s3_bucket(block_name: str) -> S3Bucket:
+    return S3Bucket.load(block_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _aws_secret(block_name: str) -> AwsSecret:
+    return AwsSecret.load(block_name)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
-# Tasks — Extract  (identical to GCS variant)
+# Tasks — Extract
 # ─────────────────────────────────────────────────────────────────────────────
 
+# The subset of the GitHub pull-request object we keep. Pages are read into
+# Arrow against this schema; any other keys in the response are dropped.
+PR_RAW_SCHEMA = pa.schema([
+    pa.field("id",               pa.int64()),
+    pa.field("number",           pa.int64()),
+    pa.field("title",            pa.string()),
+    pa.field("html_url",         pa.string()),
+    pa.field("state",            pa.string()),
+    pa.field("merge_commit_sha", pa.string()),
+    pa.field("merged",           pa.bool_()),
+    pa.field("draft",            pa.bool_()),
+    pa.field("auto_merge",       pa.struct([pa.field("merge_method", pa.string())])),
+    pa.field("created_at",       pa.string()),
+    pa.field("updated_at",       pa.string()),
+    pa.field("merged_at",        pa.string()),
+    pa.field("closed_at",        pa.string()),
+    pa.field("user",             pa.struct([pa.field("login", pa.string())])),
+    pa.field("base",             pa.struct([pa.field("ref", pa.string()), pa.field("sha", pa.string())])),
+    pa.field("head",             pa.struct([
+        pa.field("ref",  pa.string()),
+        pa.field("sha",  pa.string()),
+        pa.field("repo", pa.struct([pa.field("id", pa.int64()), pa.field("name", pa.string())])),
+    ])),
+])
+
+
 @task(retries=3, retry_delay_seconds=60)
 def fetch_pull_requests(
     github_token: str,
     org: str,
     since: datetime,
-) -> list[dict[str, Any]]:
+) -> pa.Table:
     """
-    Fetch recently updated PRs for a GitHub org via the REST API.
-    Cursor-based pagination via Link header. Identical to GCS variant.
+    Fetch recently updated PRs for a GitHub org via the REST API, as an
+    Arrow table with PR_RAW_SCHEMA.
+    Page count comes from the first response's Link header (rel="last");
+    the remaining pages are fetched concurrently, a wave at a time.
     """
     logger = get_run_logger()
     logger.info("Fetching PRs for org=%s since=%s", org, since.isoformat())
 
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept":        "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+    prs = pa.concat_tables(_iter_pages(github_token, org, since))
+
+    logger.info("Fetched %d PRs for org=%s", len(prs), org)
+    return prs
+
 
-    prs: list[dict] = []
-    url: str | None = (
+@functools.lru_cache(maxsize=1)
+def _github_client() -> tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    """
+    One HTTP/2 client for the whole process, so TLS handshakes and the
+    connection pool are shared by every org's fetch. An AsyncClient is tied
+    to the event loop it runs on, so it lives on a dedicated background loop
+    and tasks submit coroutines to it instead of calling asyncio.run().
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="github-http", daemon=True).start()
+    client = httpx.AsyncClient(
+        http2   = True,
+        timeout = 30.0,
+        limits  = httpx.Limits(max_connections=settings.max_concurrent_pages),
+        headers = {
+            "Accept":               "application/vnd.github+json",
+            "Accept-Encoding":      "gzip",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+    )
+    return loop, client
+
+
+def _iter_pages(github_token: str, org: str, since: datetime) -> Iterator[pa.Table]:
+    """
+    Yield an org's recently updated PRs one Arrow page at a time, driving
+    _page_stream on the shared HTTP loop from this (synchronous) task thread.
+    """
+    headers   = {"Authorization": f"Bearer {github_token}"}
+    first_url = (
         f"{settings.github_api_base_url}/orgs/{org}/pulls"
         f"?state=all&sort=updated&direction=desc"
         f"&per_page={settings.pr_page_size}"
         f"&since={since.isoformat()}"
     )
 
-    with httpx.Client(timeout=30.0) as client:
-        while url:
-            resp = client.get(url, headers=headers)
+    loop, client = _github_client()
+    pages = _page_stream(client, first_url, headers, since.isoformat())
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(pages.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        asyncio.run_coroutine_threadsafe(pages.aclose(), loop).result()
+
+
+async def _page_stream(
+    client: httpx.AsyncClient,
+    first_url: str,
+    headers: dict[str, str],
+    since_iso: str,
+) -> AsyncIterator[pa.Table]:
+    """
+    Yield every page of a PR listing as an Arrow table. Page 1 is fetched
+    alone to read the page count; the rest go out `max_concurrent_pages` at
+    a time. Results are newest-first: PRs older than `since` are dropped, and
+    the first page that had any ends the listing.
+    """
+    resp = await client.get(first_url, headers=headers)
+    resp.raise_for_status()
+    page   = orjson.loads(resp.content)
+    recent = _updated_since(page, since_iso)
+    yield pa.Table.from_pylist(recent, schema=PR_RAW_SCHEMA)
+
+    last_url = resp.links.get("last", {}).get("url")
+    if not last_url or len(recent) < len(page):
+        return
+
+    base_url  = httpx.URL(last_url)
+    last_page = int(base_url.params["page"])
+    for wave_start in range(2, last_page + 1, settings.max_concurrent_pages):
+        wave  = range(wave_start, min(wave_start + settings.max_concurrent_pages, last_page + 1))
+        resps = await asyncio.gather(
+            *(client.get(base_url.copy_set_param("page", page_no), headers=headers) for page_no in wave)
+        )
+        for resp in resps:
             resp.raise_for_status()
-            page = resp.json()
-            prs.extend(page)
-
-            if page and page[-1].get("updated_at", "") < since.isoformat():
-                break
+            page   = orjson.loads(resp.content)
+            recent = _updated_since(page, since_iso)
+            yield pa.Table.from_pylist(recent, schema=PR_RAW_SCHEMA)
+            if len(recent) < len(page):
+                return
 
-            links    = resp.headers.get("Link", "")
-            next_url = None
-            for part in links.split(","):
-                if 'rel="next"' in part:
-                    next_url = part.split(";")[0].strip().strip("<>")
-            url = next_url
 
-    logger.info("Fetched %d PRs for org=%s", len(prs), org)
-    return prs
+def _updated_since(page: list[dict], since_iso: str) -> list[dict]:
+    """The PRs on a page last updated at or after `since`."""
+    return [pr for pr in page if pr.get("updated_at", "") >= since_iso]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Tasks — Transform  (identical to GCS variant)
+# Tasks — Transform
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Low-cardinality strings (org, state, refs, logins, repo names) are
+# dictionary-typed: Arrow holds each distinct value once, and Parquet writes
+# them as dictionary pages without re-discovering the repetition
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# Explicit column types, so Arrow never has to infer them from the batch
+PR_SCHEMA = pa.schema([
+    pa.field("id",               pa.string()),
+    pa.field("number",           pa.int64()),
+    pa.field("org",              _DICT_STRING),
+    pa.field("repo_name",        _DICT_STRING),
+    pa.field("repo_id",          pa.string()),
+    pa.field("title",            pa.string()),
+    pa.field("url",              pa.string()),
+    pa.field("state",            _DICT_STRING),
+    pa.field("base_ref",         _DICT_STRING),
+    pa.field("head_ref",         _DICT_STRING),
+    pa.field("base_sha",         pa.string()),
+    pa.field("head_sha",         pa.string()),
+    pa.field("merge_commit_sha", pa.string()),
+    pa.field("user_login",       _DICT_STRING),
+    pa.field("is_merged",        pa.bool_()),
+    pa.field("is_draft",         pa.bool_()),
+    pa.field("auto_merge",       pa.bool_()),
+    # GitHub timestamps are UTC; stored zone-less to land as TIMESTAMP_NTZ
+    pa.field("created_at",       pa.timestamp("us")),
+    pa.field("updated_at",       pa.timestamp("us")),
+    pa.field("merged_at",        pa.timestamp("us")),
+    pa.field("closed_at",        pa.timestamp("us")),
+    pa.field("_row_key",         pa.uint64()),   # xxh3_64 of org|repo|pr_id → NUMBER(20,0)
+    pa.field("_ingested_at",     pa.timestamp("us")),   # → TIMESTAMP_NTZ
+])
+
+
+PR_ROW_GROUP_SIZE  = 8192
+PR_PARQUET_OPTIONS = {
+    "compression":       "zstd",
+    "compression_level": 3,
+    # Low-cardinality columns; every other column is effectively unique
+    "use_dictionary":    ["org", "state", "base_ref", "head_ref", "user_login", "repo_name"],
+    # COPY INTO doesn't read column statistics
+    "write_statistics":  False,
+}
+
+# PR_SCHEMA columns copied as-is from the flattened raw table (output ← source)
+_PR_RENAMES = {
+    "title":            "title",
+    "url":              "html_url",
+    "state":            "state",
+    "base_ref":         "base.ref",
+    "head_ref":         "head.ref",
+    "base_sha":         "base.sha",
+    "head_sha":         "head.sha",
+    "merge_commit_sha": "merge_commit_sha",
+    "user_login":       "user.login",
+}
+
+_PR_TIMESTAMPS = ["created_at", "updated_at", "merged_at", "closed_at"]
+
+
 @task
 def transform_pull_requests(
-    raw_prs: list[dict[str, Any]],
+    raw_prs: pa.Table,
     org: str,
-) -> bytes:
+) -> pa.Buffer:
     """
     Normalise raw PR records to canonical schema and serialise to Parquet.
-    PyArrow explicit schema, Snappy compression. Identical to GCS variant.
+    PyArrow explicit schema, Zstd compression; the Arrow buffer is returned
+    as-is for upload_to_s3. Only used when settings.stream_to_s3 is off.
     """
     logger = get_run_logger()
 
-    rows = []
-    for pr in raw_prs:
-        repo_name = pr.get("head", {}).get("repo", {}).get("name", "")
-        pr_id     = str(pr.get("id", ""))
-        rows.append({
-            "id":               pr_id,
-            "number":           int(pr.get("number", 0)),
-            "org":              org,
-            "repo_name":        repo_name,
-            "repo_id":          str(pr.get("head", {}).get("repo", {}).get("id", "")),
-            "title":            pr.get("title", ""),
-            "url":              pr.get("html_url", ""),
-            "state":            pr.get("state", ""),
-            "base_ref":         pr.get("base", {}).get("ref", ""),
-            "head_ref":         pr.get("head", {}).get("ref", ""),
-            "base_sha":         pr.get("base", {}).get("sha", ""),
-            "head_sha":         pr.get("head", {}).get("sha", ""),
-            "merge_commit_sha": pr.get("merge_commit_sha", ""),
-            "user_login":       pr.get("user", {}).get("login", ""),
-            "is_merged":        pr.get("merged", False),
-            "is_draft":         pr.get("draft", False),
-            "auto_merge":       pr.get("auto_merge") is not None,
-            "created_at":       pr.get("created_at", ""),
-            "updated_at":       pr.get("updated_at", ""),
-            "merged_at":        pr.get("merged_at", ""),
-            "closed_at":        pr.get("closed_at", ""),
-            "_row_key":         hashlib.md5(f"{org}|{repo_name}|{pr_id}".encode()).hexdigest(),
-            "_ingested_at":     datetime.utcnow().isoformat(),
-        })
-
-    table = pa.Table.from_pylist(rows)
+    table = _pr_table(raw_prs, org, datetime.utcnow())
     buf   = pa.BufferOutputStream()
-    pq.write_table(table, buf, compression="snappy")
-    logger.info("Serialised %d PR records for org=%s", len(rows), org)
-    return buf.getvalue().to_pybytes()
+    pq.write_table(table, buf, row_group_size=PR_ROW_GROUP_SIZE, **PR_PARQUET_OPTIONS)
+    logger.info("Serialised %d PR records for org=%s", table.num_rows, org)
+    return buf.getvalue()
+
+
+def _pr_table(raw_prs: pa.Table, org: str, ingested_at: datetime) -> pa.Table:
+    """Map raw PR_RAW_SCHEMA rows onto PR_SCHEMA."""
+    # Column algebra over the raw table: plain fields are renamed in place,
+    # the rest are single Arrow kernels; no per-PR Python work but the hash
+    flat        = raw_prs.flatten().flatten()
+    ids         = pc.cast(flat["id"], pa.string())
+    repo_names  = pc.fill_null(flat["head.repo.name"], "")
+    row_keys    = pc.binary_join_element_wise(org, repo_names, ids, "|").cast(pa.binary())
+
+    derived = {
+        "id":           ids,
+        "number":       pc.fill_null(flat["number"], 0),
+        "org":          pa.repeat(pa.scalar(org), raw_prs.num_rows),
+        "repo_name":    repo_names,
+        "repo_id":      pc.fill_null(pc.cast(flat["head.repo.id"], pa.string()), ""),
+        "is_merged":    pc.fill_null(flat["merged"], False),
+        "is_draft":     pc.fill_null(flat["draft"], False),
+        "auto_merge":   pc.is_valid(raw_prs["auto_merge"]),
+        "_row_key":     pa.array([xxhash.xxh3_64_intdigest(key) for key in row_keys.to_pylist()], pa.uint64()),
+        "_ingested_at": pa.repeat(pa.scalar(ingested_at, pa.timestamp("us")), raw_prs.num_rows),
+        # "...Z" strings parse as UTC; the final cast to PR_SCHEMA drops the zone
+        **{name: flat[name].cast(pa.timestamp("us", tz="UTC")) for name in _PR_TIMESTAMPS},
+    }
+
+    table = flat.select(list(_PR_RENAMES.values())).rename_columns(list(_PR_RENAMES))
+    for name, column in derived.items():
+        table = table.append_column(name, column)
+    return table.select(PR_SCHEMA.names).cast(PR_SCHEMA)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tasks — Load (AWS-specific: S3 instead of GCS)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Multipart above 8 MB, 8 MB parts, up to 8 parts uploading concurrently
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold = 8 * 1024 * 1024,
+    multipart_chunksize = 8 * 1024 * 1024,
+    max_concurrency     = 8,
+)
+
 @task(retries=3, retry_delay_seconds=30)
-def upload_to_s3(parquet_bytes: bytes, entity: str, org: str, run_date: date) -> str:
+def upload_to_s3(parquet_bytes: pa.Buffer, entity: str, org: str, run_date: date) -> str:
     """
     Upload Parquet bytes to S3 with a Hive-partitioned path.
 
-    Differences from upload_to_gcs():
+    Differences from the GCS variant (write_pull_requests_to_gcs):
       - Uses prefect_aws.S3Bucket block instead of prefect_gcp.GcsBucket
-      - S3Bucket.upload_from_file_object() takes a BytesIO — wraps bytes first
+      - Uploads one prebuilt buffer per org; the GCS task writes through
+        pyarrow's GcsFileSystem in files of settings.pr_file_rows rows
+      - S3Bucket.upload_from_file_object() takes a file object — wraps the
+        Arrow buffer in a BufferReader, which reads it in place (zero-copy)
+      - Large files go up as concurrent multipart uploads (S3_TRANSFER_CONFIG)
       - Returns an s3:// URI instead of gs://
 
-    The S3 path structure is identical to the GCS variant so Snowflake COPY
-    patterns are consistent regardless of cloud.
+    The Hive partitions (entity/org/date) match the GCS variant's, so Snowflake
+    COPY patterns are consistent regardless of cloud.
     """
     logger = get_run_logger()
 
-    path = f"github/{entity}/org={org}/date={run_date.isoformat()}/{entity}.parquet"
+    path = _s3_path(entity, org, run_date)
 
     # ── prefect-aws S3Bucket block ────────────────────────────────────────────
     # Block stores bucket name + optional AWS credentials block reference.
     # Auth resolves in order: block credentials → env vars → instance profile.
-    s3 = S3Bucket.load(settings.s3_bucket_block)
+    s3 = _s3_bucket(settings.s3_bucket_block)
+    # Extra kwargs go through to boto3 upload_fileobj: files over the threshold
+    # are sent as a multipart upload, several parts in flight at once
     s3.upload_from_file_object(
-        from_file_object=BytesIO(parquet_bytes),
+        from_file_object=pa.BufferReader(parquet_bytes),
         to_path=path,
+        Config=S3_TRANSFER_CONFIG,
     )
 
-    uri = f"s3://{s3.bucket_name}/{path}"
+    # upload_from_file_object placed it under the block's bucket_folder
+    uri = f"s3://{s3.bucket_name}/{_s3_key(s3, path)}"
     logger.info("Uploaded %s → %s", entity, uri)
     return uri
 
 
+@task(retries=3, retry_delay_seconds=60)
+def stream_pull_requests_to_s3(
+    github_token: str,
+    org: str,
+    since: datetime,
+    run_date: date,
+) -> tuple[str, int]:
+    """
+    Fetch, transform and upload in one pass: each GitHub page is mapped onto
+    PR_SCHEMA and written into a Parquet file that streams straight to S3,
+    so memory holds one row group rather than the whole org.
+
+    The file is written under a temporary key and moved into place only once
+    complete, so a failed run never leaves a truncated file under the prefix
+    Snowflake reads from. Returns (s3 URI, rows written).
+    """
+    logger = get_run_logger()
+
+    s3          = _s3_bucket(settings.s3_bucket_block)
+    fs          = _s3_filesystem(s3)
+    key         = f"{s3.bucket_name}/{_s3_key(s3, _s3_path('pull_request', org, run_date))}"
+    tmp_key     = f"{key}.inprogress"
+    ingested_at = datetime.utcnow()   # one timestamp for every page
+    rows        = 0
+
+    try:
+        with fs.open_output_stream(tmp_key) as out, \
+                pq.ParquetWriter(out, PR_SCHEMA, **PR_PARQUET_OPTIONS) as writer:
+            # Pages are ~100 rows; buffer them so each write is one full row group
+            pending: list[pa.Table] = []
+            pending_rows = 0
+            for raw_page in _iter_pages(github_token, org, since):
+                pending.append(_pr_table(raw_page, org, ingested_at))
+                pending_rows += raw_page.num_rows
+                if pending_rows >= PR_ROW_GROUP_SIZE:
+                    writer.write_table(pa.concat_tables(pending))
+                    rows += pending_rows
+                    pending, pending_rows = [], 0
+            if pending:
+                writer.write_table(pa.concat_tables(pending))
+                rows += pending_rows
+        fs.move(tmp_key, key)
+    except Exception:
+        if fs.get_file_info(tmp_key).type == pafs.FileType.File:
+            fs.delete_file(tmp_key)
+        raise
+
+    uri = f"s3://{key}"
+    logger.info("Streamed %d PR records for org=%s → %s", rows, org, uri)
+    return uri, rows
+
+
+def _s3_path(entity: str, org: str, run_date: date) -> str:
+    """Hive-partitioned object path; same partitions as the GCS variant's."""
+    return f"github/{entity}/org={org}/date={run_date.isoformat()}/{entity}.parquet"
+
+
+def _s3_key(s3: S3Bucket, path: str) -> str:
+    """
+    Object key for `path` under the block's bucket_folder. Writing through
+    Arrow bypasses S3Bucket's path resolution, so the folder is applied here
+    the way upload_from_file_object would.
+    """
+    folder = (s3.bucket_folder or "").strip("/")
+    return f"{folder}/{path}" if folder else path
+
+
+def _s3_filesystem(s3: S3Bucket) -> pafs.S3FileSystem:
+    """Arrow S3 filesystem using the same AWS credentials as the S3Bucket block."""
+    session = s3.credentials.get_boto3_session()
+    creds   = session.get_credentials().get_frozen_credentials()
+    return pafs.S3FileSystem(
+        access_key    = creds.access_key,
+        secret_key    = creds.secret_key,
+        session_token = creds.token,
+        region        = session.region_name,
+    )
+
+
 @task(retries=2, retry_delay_seconds=60)
-def copy_to_snowflake_from_s3(s3_uri: str, target_table: str) -> dict[str, int]:
+def copy_to_snowflake_from_s3(s3_uris: list[str], target_table: str) -> dict[str, int]:
     """
-    COPY Parquet from S3 into Snowflake staging, then MERGE into target.
+    COPY this run's Parquet files from S3 into Snowflake staging in one
+    statement, then MERGE into target once for all orgs.
 
     Differences from GCS variant:
       - COPY statement references an S3 storage integration, not a GCS stage
       - Auth is IAM role trust policy (no access keys ever touch Snowflake config)
       - STORAGE_INTEGRATION object must be created in Snowflake first
         (see sql/snowflake_aws_stage_setup.sql)
-
-    The MERGE logic is identical to the GCS variant.
+      - Matched rows update state and timestamps when the staged row's
+        _ingested_at is newer; the GCS MERGE only refreshes _fivetran_synced
     """
     import os
-    import snowflake.connector
 
     logger = get_run_logger()
 
-    conn = snowflake.connector.connect(
-        account   = os.environ["SNOWFLAKE_ACCOUNT"],
-        user      = os.environ["SNOWFLAKE_USER"],
-        # Key-pair auth — same as GCS variant, Snowflake is cloud-agnostic
-        private_key_path = os.environ["SNOWFLAKE_PRIVATE_KEY_PATH"],
-        role      = os.environ.get("SNOWFLAKE_ROLE",      "TRANSFORMER"),
-        warehouse = os.environ.get("SNOWFLAKE_WAREHOUSE", "ETL__MEDIUM"),
-        database  = "GITHUB_PIPELINES",
-        schema    = "RAW_TABLES",
-        session_parameters={"QUERY_TAG": f"prefect:github_pr_ingestion_aws:{target_table}"},
-    )
+    conn = _snowflake_conn(target_table)
+    if conn.is_closed():
+        # Session dropped since the last run (network blip, warehouse restart)
+        _snowflake_conn.cache_clear()
+        conn = _snowflake_conn(target_table)
     cur = conn.cursor()
     stage_table = f"{target_table}_STAGE"
 
+    # One COPY over the files' common prefix; FILES pins it to exactly this
+    # run's uploads, and Snowflake loads them in parallel
+    prefix = os.path.commonprefix(s3_uris).rsplit("/", 1)[0] + "/"
+    files  = ", ".join(f"'{uri[len(prefix):]}'" for uri in s3_uris)
+
     # ── COPY from S3 using named stage with storage integration ───────────────
     # The @github_s3_stage was created with STORAGE_INTEGRATION = s3_snowflake_integration
     # (IAM role) — no access keys embedded in the COPY command.
     # Equivalent GCS COPY: FROM 'gs://...' CREDENTIALS=(...) or via named stage.
     cur.execute(f"""
         COPY INTO {stage_table}
-        FROM '{s3_uri}'
+        FROM '{prefix}'
+        FILES = ({files})
         STORAGE_INTEGRATION = s3_snowflake_integration
         FILE_FORMAT = (
             TYPE             = 'PARQUET'
             USE_LOGICAL_TYPE = TRUE
-            SNAPPY_COMPRESSION = TRUE
         )
         ON_ERROR = 'ABORT_STATEMENT'
         PURGE    = FALSE
     """)
 
-    # ── MERGE — identical to GCS variant ─────────────────────────────────────
+    # ── MERGE ────────────────────────────────────────────────────────────────
     result = cur.execute(f"""
         MERGE INTO {target_table} AS tgt
         USING {stage_table} AS src
@@ -276,7 +550,6 @@ def copy_to_snowflake_from_s3(s3_uri: str, target_table: str) -> dict[str, int]:
 
     cur.execute(f"TRUNCATE TABLE {stage_table}")
     cur.close()
-    conn.close()
 
     metrics = {
         "rows_inserted": result[0] if result else 0,
@@ -286,6 +559,56 @@ def copy_to_snowflake_from_s3(s3_uri: str, target_table: str) -> dict[str, int]:
     return metrics
 
 
+@functools.lru_cache(maxsize=None)
+def _snowflake_conn(target_table: str):
+    """
+    One Snowflake session per target table for the life of the worker process,
+    so repeat flow runs skip the key-pair auth handshake and session setup.
+    """
+    import os
+    import snowflake.connector
+
+    return snowflake.connector.connect(
+        account   = os.environ["SNOWFLAKE_ACCOUNT"],
+        user      = os.environ["SNOWFLAKE_USER"],
+        # Key-pair auth — same as GCS variant, Snowflake is cloud-agnostic
+        private_key_path = os.environ["SNOWFLAKE_PRIVATE_KEY_PATH"],
+        role      = os.environ.get("SNOWFLAKE_ROLE",      "TRANSFORMER"),
+        warehouse = os.environ.get("SNOWFLAKE_WAREHOUSE", "ETL__MEDIUM"),
+        database  = "GITHUB_PIPELINES",
+        schema    = "RAW_TABLES",
+        # Idle between scheduled runs; keep the session token from expiring
+        client_session_keep_alive = True,
+        session_parameters={"QUERY_TAG": f"prefect:github_pr_ingestion_aws:{target_table}"},
+    )
+
+
+def backfill_row_key_map(target_table: str = "PULL_REQUEST") -> int:
+    """
+    One-off: fill {target_table}_ROW_KEY_MAP with the xxh3 key for every MD5
+    _row_key already in target_table (see the MIGRATION section of
+    sql/snowflake_aws_stage_setup.sql). Snowflake has no xxh3 function, so the
+    keys are computed here with the same org|repo_name|id input as _pr_table.
+
+    Returns the number of keys mapped.
+    """
+    conn = _snowflake_conn(target_table)
+    cur  = conn.cursor()
+    rows = cur.execute(
+        f"SELECT DISTINCT _row_key, org, repo_name, id FROM {target_table}"
+    ).fetchall()
+    mapping = [
+        (old_key, xxhash.xxh3_64_intdigest(f"{org}|{repo_name or ''}|{pr_id}".encode()))
+        for old_key, org, repo_name, pr_id in rows
+    ]
+    cur.executemany(
+        f"INSERT INTO {target_table}_ROW_KEY_MAP (old_key, new_key) VALUES (%s, %s)",
+        mapping,
+    )
+    cur.close()
+    return len(mapping)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main flow
 # ─────────────────────────────────────────────────────────────────────────────
@@ -301,19 +624,22 @@ def github_pr_ingestion_flow_aws(
     Steps:
       1. Load GitHub API token from AWS Secrets Manager via Prefect AwsSecret block
          (GCS variant uses GcpSecret → GCP Secret Manager)
-      2. For each org: fetch PRs updated in the lookback window  ← identical
-      3. Transform to Parquet with PyArrow                       ← identical
+      2. For each org: fetch PRs updated in the lookback window
+      3. Transform to Parquet with PyArrow
       4. Upload to S3 (prefect-aws S3Bucket block)
-         (GCS variant uploads to GCS via GcsBucket block)
-      5. COPY from S3 + MERGE into Snowflake
-         (GCS variant uses GCS stage; MERGE logic is identical)
+         (GCS variant writes to GCS through pyarrow's GcsFileSystem)
+      5. One COPY from S3 + one MERGE into Snowflake for all orgs
+         (GCS variant also runs one COPY + MERGE per run, from GCS)
+
+    With settings.stream_to_s3 (the default), steps 2–4 run as a single
+    task that writes each page into the S3 file as it arrives.
 
     Args:
         orgs:          Override list of GitHub orgs.
         lookback_days: Override lookback window (default: 3 days).
 
     Returns:
-        Summary dict with row counts per org and run metadata.
+        Summary dict with row counts per org, merge counts and run metadata.
     """
     logger      = get_run_logger()
     active_orgs = orgs or settings.github_orgs
@@ -330,42 +656,64 @@ def github_pr_ingestion_flow_aws(
     # GCS variant: GcpSecret.load(block).read_secret().decode("utf-8").strip()
     # AWS variant: AwsSecret.load(block).read_secret()  ← returns str directly
     try:
-        token: str = AwsSecret.load(settings.aws_secret_block).read_secret()
+        token: str = _aws_secret(settings.aws_secret_block).read_secret()
     except Exception as exc:
         logger.error("Failed to load GitHub token from AWS Secrets Manager: %s", exc)
         return Failed(message=str(exc))
 
     summary: dict[str, Any] = {}
 
+    # Steps 2–4 for every org are submitted up front and run concurrently:
+    # each org's work is I/O against GitHub and S3, independent of the others
+    staged: dict[str, Any] = {}
     for org in active_orgs:
-        try:
-            # Steps 2–3 are identical to the GCS variant
-            raw_prs  = fetch_pull_requests(github_token=token, org=org, since=since)
-            pr_bytes = transform_pull_requests(raw_prs=raw_prs, org=org)
+        if settings.stream_to_s3:
+            # Steps 2–4 in one pass, page by page
+            staged[org] = stream_pull_requests_to_s3.submit(
+                github_token=token, org=org, since=since, run_date=run_date,
+            )
+        else:
+            # Steps 2–3 as separate tasks
+            raw_prs  = fetch_pull_requests.submit(github_token=token, org=org, since=since)
+            pr_bytes = transform_pull_requests.submit(raw_prs=raw_prs, org=org)
 
-            # Step 4: upload to S3 (GCS variant calls upload_to_gcs)
-            pr_uri   = upload_to_s3(
+            # Step 4: upload to S3
+            pr_uri   = upload_to_s3.submit(
                 parquet_bytes=pr_bytes,
                 entity="pull_request",
                 org=org,
                 run_date=run_date,
             )
+            staged[org] = (pr_uri, raw_prs)
 
-            # Step 5: COPY from S3 + MERGE (GCS variant calls copy_to_snowflake)
-            metrics  = copy_to_snowflake_from_s3(
-                s3_uri=pr_uri,
-                target_table="PULL_REQUEST",
-            )
+    s3_uris: list[str] = []
+    for org, future in staged.items():
+        try:
+            if settings.stream_to_s3:
+                pr_uri, prs_fetched = future.result()
+            else:
+                uri_future, raw_future = future
+                pr_uri, prs_fetched = uri_future.result(), raw_future.result().num_rows
 
-            summary[org] = {"prs_fetched": len(raw_prs), **metrics}
+            s3_uris.append(pr_uri)
+            summary[org] = {"prs_fetched": prs_fetched, "s3_uri": pr_uri}
 
         except Exception as exc:
             logger.error("Org %s failed: %s", org, exc)
             summary[org] = {"error": str(exc)}
 
+    # Step 5: one COPY from S3 + one MERGE for every org that uploaded
+    merge: dict[str, Any] = {}
+    if s3_uris:
+        try:
+            merge = copy_to_snowflake_from_s3(s3_uris=s3_uris, target_table="PULL_REQUEST")
+        except Exception as exc:
+            logger.error("Snowflake load failed: %s", exc)
+            merge = {"error": str(exc)}
+
     total = sum(v.get("prs_fetched", 0) for v in summary.values())
     logger.info("github-pr-ingestion-aws complete. Total PRs: %d", total)
-    return {"orgs": summary, "total_prs": total, "run_date": run_date.isoformat()}
+    return {"orgs": summary, "merge": merge, "total_prs": total, "run_date": run_date.isoformat()}
 
 
 if __name__ == "__main__":
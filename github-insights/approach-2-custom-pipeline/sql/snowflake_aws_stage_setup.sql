@@ -13,6 +13,9 @@
 --   Step 4  Create the external stage in Snowflake
 --   Step 5  Create the file format
 --   Step 6  Verify with a LIST command
+--
+-- Existing deployments upgrading from the MD5 _row_key: run the MIGRATION
+-- section below before deploying the xxh3 flow code.
 -- ─────────────────────────────────────────────────────────────────────────────
 
 -- ── Prerequisites ─────────────────────────────────────────────────────────────
@@ -140,7 +143,7 @@ CREATE OR REPLACE STAGE github_s3_stage
 CREATE OR REPLACE FILE FORMAT parquet_snappy
     TYPE                = 'PARQUET'
     USE_LOGICAL_TYPE    = TRUE    -- preserves timestamps, booleans as Parquet types
-    SNAPPY_COMPRESSION  = TRUE
+    -- no codec option: Parquet records its own (the AWS flow writes Zstd)
     NULL_IF             = ('', 'NULL', 'null');
 
 
@@ -158,20 +161,84 @@ FROM @github_s3_stage/pull_request/
 LIMIT 5;
 
 
+-- ─────────────────────────────────────────────────────────────────────────────
+-- MIGRATION — MD5 _row_key → xxh3_64 NUMBER(20,0), string → TIMESTAMP_NTZ
+--             timestamps  (existing deployments only)
+-- ─────────────────────────────────────────────────────────────────────────────
+-- Earlier versions of the flow keyed rows on an MD5 hex string of
+-- org|repo_name|id. The flow now writes a uint64 xxh3_64 of the same string, so
+-- without this migration every existing PR would fail to match in the MERGE
+-- and be inserted a second time.
+--
+-- Deploy order:
+--   1. Pause the github-pr-ingestion-aws deployment (no run may MERGE mid-way)
+--   2. M1 below, then fill the key map from Python — Snowflake has no xxh3:
+--        python -c "from prefect_flows.github_pr_ingestion_flow_aws import backfill_row_key_map; backfill_row_key_map('PULL_REQUEST')"
+--   3. M2–M4 below
+--   4. Deploy the xxh3 flow code and resume the deployment
+
+USE ROLE      TRANSFORMER;
+USE DATABASE  GITHUB_PIPELINES;
+USE SCHEMA    RAW_TABLES;
+
+-- M1: old → new key map, filled by backfill_row_key_map()
+CREATE OR REPLACE TABLE PULL_REQUEST_ROW_KEY_MAP (
+    old_key  VARCHAR       NOT NULL,
+    new_key  NUMBER(20,0)  NOT NULL
+);
+
+-- M2: rebuild the target with the new key. Columns are listed in the flow's
+-- PR_SCHEMA order because the MERGE inserts with a positional SELECT *.
+-- The inner join drops nothing: every existing _row_key is in the map.
+-- The old flow wrote the timestamps as ISO strings; the new one writes Parquet
+-- timestamps, so convert them here too. Left as strings, the MERGE guard would
+-- compare '… HH:MI' against '…THH:MI' and skip same-day updates.
+CREATE OR REPLACE TABLE PULL_REQUEST COPY GRANTS AS
+SELECT
+    t.id, t.number, t.org, t.repo_name, t.repo_id, t.title, t.url, t.state,
+    t.base_ref, t.head_ref, t.base_sha, t.head_sha, t.merge_commit_sha,
+    t.user_login, t.is_merged, t.is_draft, t.auto_merge,
+    TRY_TO_TIMESTAMP_NTZ(t.created_at)   AS created_at,
+    TRY_TO_TIMESTAMP_NTZ(t.updated_at)   AS updated_at,
+    TRY_TO_TIMESTAMP_NTZ(t.merged_at)    AS merged_at,
+    TRY_TO_TIMESTAMP_NTZ(t.closed_at)    AS closed_at,
+    m.new_key::NUMBER(20,0)              AS _row_key,
+    TRY_TO_TIMESTAMP_NTZ(t._ingested_at) AS _ingested_at
+FROM PULL_REQUEST AS t
+JOIN PULL_REQUEST_ROW_KEY_MAP AS m
+  ON m.old_key = t._row_key;
+
+-- M3: staging is empty between runs; recreate it with the new column type
+CREATE OR REPLACE TABLE PULL_REQUEST_STAGE LIKE PULL_REQUEST COPY GRANTS;
+
+-- M4: check, then drop the map
+SELECT COUNT(*) = COUNT(DISTINCT _row_key) AS keys_unique FROM PULL_REQUEST;
+DROP TABLE PULL_REQUEST_ROW_KEY_MAP;
+
+
 -- ─────────────────────────────────────────────────────────────────────────────
 -- COPY + MERGE pattern (called by the Prefect flow on each run)
 -- ─────────────────────────────────────────────────────────────────────────────
 -- The Prefect flow calls these dynamically. Shown here for reference.
 
--- COPY from a specific S3 file (called by copy_to_snowflake_from_s3 task)
+-- COPY every org's file for the run in one statement (called once per flow run
+-- by copy_to_snowflake_from_s3; FILES lists exactly the files that run uploaded)
 COPY INTO GITHUB_PIPELINES.RAW_TABLES.PULL_REQUEST_STAGE
-FROM 's3://your-data-bucket/github/pull_request/org=my-org/date=2024-01-15/pull_request.parquet'
+FROM 's3://your-data-bucket/github/pull_request/'
+FILES = (
+    'org=org-a/date=2024-01-15/pull_request.parquet',
+    'org=org-b/date=2024-01-15/pull_request.parquet'
+)
 STORAGE_INTEGRATION = s3_snowflake_integration
 FILE_FORMAT         = (FORMAT_NAME = parquet_snappy)
 ON_ERROR            = 'ABORT_STATEMENT'
 PURGE               = FALSE;   -- keep source file; Prefect manages lifecycle
 
 -- MERGE staging → target  (identical to GCS variant — Snowflake is cloud-agnostic)
+-- The AWS flow writes _row_key as a uint64 xxh3_64 hash (not an MD5 hex string),
+-- so _row_key is NUMBER(20,0) in both PULL_REQUEST and PULL_REQUEST_STAGE.
+-- _ingested_at and created_at/updated_at/merged_at/closed_at are written as Parquet
+-- timestamps (µs, UTC wall-clock) and land as TIMESTAMP_NTZ.
 MERGE INTO GITHUB_PIPELINES.RAW_TABLES.PULL_REQUEST AS tgt
 USING GITHUB_PIPELINES.RAW_TABLES.PULL_REQUEST_STAGE AS src
 ON tgt._row_key = src._row_key
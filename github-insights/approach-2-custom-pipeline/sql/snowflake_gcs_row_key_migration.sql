@@ -0,0 +1,66 @@
+-- snowflake_gcs_row_key_migration.sql
+-- ─────────────────────────────────────────────────────────────────────────────
+-- One-time migration for the GCS flow: MD5 _row_key → xxh3_64 NUMBER(20,0).
+--
+-- Earlier versions of github_pr_ingestion_flow.py keyed rows on an MD5 hex
+-- string of org|repo_name|id. The flow now writes a uint64 xxh3_64 of the same
+-- string, so without this migration every existing PR would fail to match in
+-- the MERGE and be inserted a second time. New deployments can skip this file.
+--
+-- Deploy order:
+--   1. Pause the github-pr-ingestion-gcs deployment (no run may MERGE mid-way)
+--   2. Step 1 below, then fill the key map from Python — Snowflake has no xxh3:
+--        python -c "from prefect_flows.github_pr_ingestion_flow import backfill_row_key_map; backfill_row_key_map('PULL_REQUEST')"
+--   3. Steps 2–4 below
+--   4. Deploy the xxh3 flow code and resume the deployment
+-- ─────────────────────────────────────────────────────────────────────────────
+
+USE ROLE      TRANSFORMER;
+USE DATABASE  RAW;
+USE SCHEMA    GITHUB;
+
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 1 — Old → new key map, filled by backfill_row_key_map()
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE OR REPLACE TABLE PULL_REQUEST_ROW_KEY_MAP (
+    old_key  VARCHAR       NOT NULL,
+    new_key  NUMBER(20,0)  NOT NULL
+);
+
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 2 — Rebuild the target with the new key
+-- ─────────────────────────────────────────────────────────────────────────────
+-- Columns are listed in the flow's PR_SCHEMA order because the MERGE inserts
+-- with a positional SELECT *. The inner join drops nothing: every existing
+-- _row_key is in the map.
+
+CREATE OR REPLACE TABLE PULL_REQUEST COPY GRANTS AS
+SELECT
+    t.id, t.number, t.org, t.repo_name, t.repo_id, t.title, t.url, t.state,
+    t.base_ref, t.head_ref, t.base_sha, t.head_sha, t.merge_commit_sha,
+    t.user_login, t.is_merged, t.is_draft, t.auto_merge,
+    t.created_at, t.updated_at, t.merged_at, t.closed_at,
+    m.new_key::NUMBER(20,0) AS _row_key,
+    t._fivetran_synced
+FROM PULL_REQUEST AS t
+JOIN PULL_REQUEST_ROW_KEY_MAP AS m
+  ON m.old_key = t._row_key;
+
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 3 — Staging is empty between runs; recreate it with the new column type
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE OR REPLACE TABLE PULL_REQUEST_STAGE LIKE PULL_REQUEST COPY GRANTS;
+
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 4 — Verify, then drop the map
+-- ─────────────────────────────────────────────────────────────────────────────
+
+SELECT COUNT(*) = COUNT(DISTINCT _row_key) AS keys_unique FROM PULL_REQUEST;
+
+DROP TABLE PULL_REQUEST_ROW_KEY_MAP;
@@ -193,7 +193,7 @@ def normalize_ide_tool(
 
 
 @task
-def build_parquet(rows: list[dict[str, Any]]) -> bytes:
+def build_parquet(rows: list[dict[str, Any]]) -> pa.Buffer:
     """
     Serialise unified metrics rows to Parquet.
     Adds a row-level id: md5(email|date|tool).
@@ -208,16 +208,16 @@ def build_parquet(rows: list[dict[str, Any]]) -> bytes:
     buf   = pa.BufferOutputStream()
     pq.write_table(table, buf)
     logger.info("Built Parquet: %d rows", len(rows))
-    return buf.getvalue().to_pybytes()
+    return buf.getvalue()   # Arrow buffer; no second copy as Python bytes
 
 
 @task
-def upload_parquet(parquet_bytes: bytes, report_date: date) -> str:
+def upload_parquet(parquet_bytes: pa.Buffer, report_date: date) -> str:
     """Upload unified Parquet file to GCS staging bucket."""
     logger = get_run_logger()
     gcs  = GcsBucket.load(settings.gcs_bucket_block)
     path = f"ai_tool_metrics/date={report_date.isoformat()}/metrics.parquet"
-    gcs.write_path(path=path, content=parquet_bytes)
+    gcs.upload_from_file_object(pa.BufferReader(parquet_bytes), path)   # streamed in place
     uri  = f"gs://{gcs.bucket}/{path}"
     logger.info("Uploaded to %s", uri)
     return uri
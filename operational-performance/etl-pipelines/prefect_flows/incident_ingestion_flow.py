@@ -110,7 +110,7 @@ def fetch_incidents(
 def transform_incidents(
     raw: list[dict[str, Any]],
     workspace: str,
-) -> bytes:
+) -> pa.Buffer:
     """
     Normalise raw incident records and serialise to Parquet.
 
@@ -168,12 +168,12 @@ def transform_incidents(
     buf = pa.BufferOutputStream()
     pq.write_table(table, buf)
     logger.info("Transformed %d incidents for workspace=%s", len(rows), workspace)
-    return buf.getvalue().to_pybytes()
+    return buf.getvalue()   # Arrow buffer; no second copy as Python bytes
 
 
 @task
 def upload_to_gcs(
-    parquet_bytes: bytes,
+    parquet_bytes: pa.Buffer,
     workspace: str,
     run_date: str,
 ) -> str:
@@ -181,7 +181,7 @@ def upload_to_gcs(
     Upload Parquet file to GCS staging bucket.
 
     Args:
-        parquet_bytes: Serialised Parquet data.
+        parquet_bytes: Serialised Parquet data (Arrow buffer).
         workspace: Workspace identifier (used in file path).
         run_date: Run date string (YYYY-MM-DD) for partitioning.
 
@@ -191,9 +191,11 @@ def upload_to_gcs(
     logger = get_run_logger()
     gcs = GcsBucket.load(settings.gcs_bucket_block)
     path = f"incidents/{workspace}/date={run_date}/incidents.parquet"
-    gcs.write_path(path=path, content=parquet_bytes)
+    # BufferReader streams the Arrow buffer in place (write_path would copy
+    # it into a BytesIO first)
+    gcs.upload_from_file_object(pa.BufferReader(parquet_bytes), path)
     gcs_uri = f"gs://{gcs.bucket}/{path}"
-    logger.info("Uploaded to %s (%d bytes)", gcs_uri, len(parquet_bytes))
+    logger.info("Uploaded to %s (%d bytes)", gcs_uri, parquet_bytes.size)
     return gcs_uri
 
 
@@ -15,6 +15,7 @@ incremental loads without duplicates.
 import logging
 import os
 import tempfile
+import time
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -35,6 +36,8 @@ class SnowflakeLoaderConfig:
     warehouse: Optional[str] = None
     role: Optional[str] = None
     update_columns: list[str] = field(default_factory=list)  # Columns to update on match
+    stage_chunk_rows: int = 500_000          # Rows per staged Parquet file
+    stage_put_threads: int = 8               # Concurrent PUT uploads while staging
     # Snowflake account / user / password read from env — not stored here
 
 
@@ -49,6 +52,10 @@ class SnowflakeLoader:
     def __init__(self, config: SnowflakeLoaderConfig):
         self.config = config
         self._conn: Optional[snowflake.connector.SnowflakeConnection] = None
+        # stage table → column names, so repeat loads skip the metadata query
+        self._stage_col_cache: dict[str, list[str]] = {}
+        # Query ID of a stage TRUNCATE still running server-side
+        self._pending_truncate: Optional[str] = None
 
     # ------------------------------------------------------------------
     # Connection lifecycle
@@ -76,6 +83,7 @@ class SnowflakeLoader:
 
     def disconnect(self) -> None:
         if self._conn:
+            self._await_truncate()
             self._conn.close()
             self._conn = None
 
@@ -122,6 +130,7 @@ class SnowflakeLoader:
 
     def _write_to_stage(self, df: pd.DataFrame, stage_table: str) -> None:
         """Write DataFrame to the staging table via write_pandas (Parquet internally)."""
+        self._await_truncate()
         success, nchunks, nrows, _ = write_pandas(
             conn=self._conn,
             df=df,
@@ -131,10 +140,21 @@ class SnowflakeLoader:
             auto_create_table=True,
             overwrite=True,
             quote_identifiers=False,
+            # Split into several files and PUT them concurrently, so COPY can
+            # also load them in parallel
+            chunk_size=self.config.stage_chunk_rows,
+            parallel=self.config.stage_put_threads,
+            compression="snappy",
+            use_logical_type=True,
         )
         if not success:
             raise RuntimeError(f"write_pandas failed for staging table {stage_table}")
 
+        # overwrite=True recreates the stage from df, so a new shape means the
+        # cached column list is stale
+        if self._stage_col_cache.get(stage_table) != [str(c).lower() for c in df.columns]:
+            self._stage_col_cache.pop(stage_table, None)
+
         logger.debug(
             "Staged rows",
             extra={"stage_table": stage_table, "rows": nrows, "chunks": nchunks},
@@ -149,6 +169,8 @@ class SnowflakeLoader:
             f"tgt.{k} = src.{k}" for k in self.config.merge_keys
         )
 
+        stage_cols = ", ".join(f"src.{c}" for c in self._get_stage_columns(stage_table))
+
         update_cols = self.config.update_columns
         update_clause = ", ".join(f"tgt.{c} = src.{c}" for c in update_cols) if update_cols else ""
 
@@ -159,8 +181,8 @@ class SnowflakeLoader:
             WHEN MATCHED {"AND (" + " OR ".join(f"tgt.{c} <> src.{c}" for c in update_cols) + ")" if update_cols else ""}
                 THEN UPDATE SET {update_clause if update_clause else "tgt._loaded_at = src._loaded_at"}
             WHEN NOT MATCHED
-                THEN INSERT ({", ".join(f"src.{c}" for c in self._get_stage_columns(stage_table))})
-                     VALUES ({", ".join(f"src.{c}" for c in self._get_stage_columns(stage_table))})
+                THEN INSERT ({stage_cols})
+                     VALUES ({stage_cols})
         """
 
         cursor = self._conn.cursor()
@@ -175,21 +197,38 @@ class SnowflakeLoader:
         }
 
     def _truncate_stage(self, stage_table: str) -> None:
+        """
+        Submit the TRUNCATE without waiting for it, so it runs while the caller
+        moves on. The next stage write (or disconnect) waits for it first.
+        """
         cursor = self._conn.cursor()
-        cursor.execute(
+        cursor.execute_async(
             f"TRUNCATE TABLE IF EXISTS "
             f"{self.config.database}.{self.config.schema}.{stage_table}"
         )
+        self._pending_truncate = cursor.sfqid
         cursor.close()
 
+    def _await_truncate(self) -> None:
+        """Block until a submitted TRUNCATE finishes; raises if it failed."""
+        query_id, self._pending_truncate = self._pending_truncate, None
+        if query_id is None:
+            return
+        while self._conn.is_still_running(self._conn.get_query_status_throw(query_id)):
+            time.sleep(0.1)
+
     def _get_stage_columns(self, stage_table: str) -> list[str]:
+        cols = self._stage_col_cache.get(stage_table)
+        if cols is not None:
+            return cols
+
+        # DESC TABLE is a local metadata call (no information_schema scan) and
+        # lists columns in ordinal order
         cursor = self._conn.cursor()
         cursor.execute(
-            f"SELECT column_name FROM information_schema.columns "
-            f"WHERE table_schema = '{self.config.schema.upper()}' "
-            f"AND table_name = '{stage_table.upper()}' "
-            f"ORDER BY ordinal_position"
+            f"DESC TABLE {self.config.database}.{self.config.schema}.{stage_table}"
         )
-        cols = [row[0].lower() for row in cursor.fetchall()]
+        cols = [row[0].lower() for row in cursor.fetchall()]  # name
         cursor.close()
+        self._stage_col_cache[stage_table] = cols
         return cols
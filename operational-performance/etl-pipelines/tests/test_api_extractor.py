@@ -0,0 +1,130 @@
+"""Unit tests for the APIExtractor's prefetching and ETag revalidation."""
+
+import threading
+import time
+
+import orjson
+import pytest
+
+from src.extractors.api_extractor import APIExtractor, APIExtractorConfig
+
+
+BATCH_SIZE = 10
+
+
+@pytest.fixture
+def extractor():
+    config = APIExtractorConfig(source_name="test_api", batch_size=BATCH_SIZE)
+    # The subclass fields are plain class attributes, not dataclass fields
+    config.base_url = "https://api.example.com"
+    config.endpoint = "/v1/orders"
+    config.prefetch_depth = 3
+    extractor = APIExtractor(config)
+    extractor._connect = lambda: None
+    extractor._disconnect = lambda: None
+    return extractor
+
+
+def _stub_source(extractor, total):
+    """Serve ``total`` records by offset; earlier batches answer slowest."""
+    calls = []
+    lock = threading.Lock()
+
+    def fetch_batch(offset, limit, since=None):
+        with lock:
+            calls.append(offset)
+        # Out-of-order completion: the prefetcher must still yield in order
+        time.sleep(max(0, 3 - offset // limit) * 0.01)
+        return [{"id": i} for i in range(offset, min(offset + limit, total))]
+
+    extractor._fetch_batch = fetch_batch
+    return calls
+
+
+class TestPrefetchPagination:
+    @pytest.mark.parametrize("total", [0, 3 * BATCH_SIZE, 3 * BATCH_SIZE + 5])
+    def test_records_complete_and_in_order(self, extractor, total):
+        _stub_source(extractor, total)
+        result = extractor.extract()
+        assert not result.has_errors
+        assert [r["id"] for r in result.records] == list(range(total))
+        assert result.row_count == total
+
+    @pytest.mark.parametrize("total", [0, 3 * BATCH_SIZE, 3 * BATCH_SIZE + 5])
+    def test_no_batch_fetched_twice(self, extractor, total):
+        calls = _stub_source(extractor, total)
+        extractor.extract()
+        assert len(calls) == len(set(calls))
+
+    def test_stops_after_short_last_page(self, extractor):
+        calls = _stub_source(extractor, 2 * BATCH_SIZE + 5)
+        extractor.extract()
+        # Batches past the short page are never requested beyond the prefetch window
+        assert max(calls) <= (2 + extractor.config.prefetch_depth) * BATCH_SIZE
+
+    def test_cursor_pagination_falls_back_to_sequential(self, extractor):
+        extractor.config.pagination_type = "cursor"
+        _stub_source(extractor, BATCH_SIZE + 5)
+        result = extractor.extract()
+        assert [r["id"] for r in result.records] == list(range(BATCH_SIZE + 5))
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, etag=None):
+        self.status_code = status_code
+        self.content = orjson.dumps(body) if body is not None else b""
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+class TestETagRevalidation:
+    def test_304_returns_cached_records(self, extractor):
+        records = [{"id": 1}, {"id": 2}]
+        extractor._session = _FakeSession([
+            _FakeResponse(200, {"data": records}, etag='"v1"'),
+            _FakeResponse(304),
+        ])
+
+        first = extractor._fetch_batch(0, BATCH_SIZE)
+        second = extractor._fetch_batch(0, BATCH_SIZE)
+
+        assert first == records
+        assert second == records
+        assert extractor._session.sent_headers == [None, {"If-None-Match": '"v1"'}]
+
+    def test_no_etag_means_no_conditional_request(self, extractor):
+        extractor._session = _FakeSession([
+            _FakeResponse(200, {"data": [{"id": 1}]}),
+            _FakeResponse(200, {"data": [{"id": 1}, {"id": 2}]}),
+        ])
+
+        extractor._fetch_batch(0, BATCH_SIZE)
+        second = extractor._fetch_batch(0, BATCH_SIZE)
+
+        assert second == [{"id": 1}, {"id": 2}]
+        assert extractor._session.sent_headers == [None, None]
+
+    def test_cache_is_keyed_by_params(self, extractor):
+        extractor._session = _FakeSession([
+            _FakeResponse(200, {"data": [{"id": 1}]}, etag='"a"'),
+            _FakeResponse(200, {"data": [{"id": 11}]}, etag='"b"'),
+        ])
+
+        extractor._fetch_batch(0, BATCH_SIZE)
+        extractor._fetch_batch(BATCH_SIZE, BATCH_SIZE)
+
+        # A different offset is a different request: no If-None-Match sent
+        assert extractor._session.sent_headers == [None, None]